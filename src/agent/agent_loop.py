@@ -24,17 +24,19 @@ import asyncio
 import json
 import logging
 import queue
+import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable
 
 from src.agent.llm import MODEL, chat_completion
 from src.agent.tools.registry import ToolRegistry, get_default_tools, get_restricted_tools
 from src.agent.tools.truncation import execute_with_budget
 from src.agent.system_prompt import STATIC_SYSTEM_PROMPT, build_runtime_context
 from src.config import get_settings
+from src.memory.session_index import append_session_entry, iter_jsonl
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +52,20 @@ TOOL_CALL_SUMMARY_THRESHOLD = 8  # Inject summary reminder after N consecutive t
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 SESSIONS_DIR = DATA_DIR / "sessions"
 
+# Compiled once: both checks below run after every turn.
+_GREETING_NAME_RE = re.compile(
+    r"(?:Hallo|Hi|Hey|Hello|Servus|Moin)\s+([A-Z][a-zu\u00e4\u00f6\u00fc]{2,})"
+)
+
+# (dotted profile path, predicate) pairs that must all hold to finish onboarding.
+_ONBOARDING_REQUIRED: list[tuple[str, Callable[[object], bool]]] = [
+    ("name", lambda v: bool(v) and v != "Athlete"),
+    ("sports", bool),
+    ("goal.event", bool),
+    ("constraints.training_days_per_week", bool),
+    ("constraints.max_session_minutes", bool),
+]
+
 
 # -- Types -------------------------------------------------------------------
 
@@ -80,7 +96,7 @@ ProgressCallback = Callable[[str, str], None] | None
 _MAX_LOADED_PAIRS = 16  # Max user/assistant pairs to keep from session history
 
 
-def _extract_user_assistant_pairs(rows: list[dict], source: str = "supabase") -> list[dict]:
+def _extract_user_assistant_pairs(rows: Iterable[dict], source: str = "supabase") -> list[dict]:
     """Build a well-formed user/assistant message list from raw DB rows.
 
     Raw session rows contain user, model, and tool_call entries.  When tool-call
@@ -211,6 +227,10 @@ class AgentLoop:
             SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
             self._session_id = datetime.now().strftime("session_%Y-%m-%d_%H%M%S")
             self._session_file = SESSIONS_DIR / f"{self._session_id}.jsonl"
+            append_session_entry(
+                self._session_id, self._session_file,
+                context=self.context, sessions_dir=SESSIONS_DIR,
+            )
 
         return self._session_id
 
@@ -263,15 +283,7 @@ class AgentLoop:
             if not self._session_file.exists():
                 logger.warning("Session file %s not found, starting fresh", session_id)
                 return session_id
-            entries = []
-            for line in self._session_file.read_text(encoding="utf-8").splitlines():
-                if not line.strip():
-                    continue
-                try:
-                    entries.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-            raw_pairs = _extract_user_assistant_pairs(entries, source="jsonl")
+            raw_pairs = _extract_user_assistant_pairs(iter_jsonl(self._session_file), source="jsonl")
 
         for msg in raw_pairs:
             self._messages.append(msg)
@@ -345,19 +357,13 @@ class AgentLoop:
         profile = self.user_model.project_profile()
 
         if not profile.get("name") or profile.get("name") == "Athlete":
-            import re
-            name_patterns = [
-                r"(?:Hallo|Hi|Hey|Hello|Servus|Moin)\s+([A-Z][a-zu\u00e4\u00f6\u00fc]{2,})",
-            ]
-            for pattern in name_patterns:
-                match = re.search(pattern, response_text)
-                if match:
-                    logger.warning(
-                        "POST-TURN CHECK: Agent greeted '%s' but profile.name is empty. "
-                        "The agent should have called update_profile(field='name').",
-                        match.group(1),
-                    )
-                    break
+            match = _GREETING_NAME_RE.search(response_text)
+            if match:
+                logger.warning(
+                    "POST-TURN CHECK: Agent greeted '%s' but profile.name is empty. "
+                    "The agent should have called update_profile(field='name').",
+                    match.group(1),
+                )
 
     def _check_onboarding_complete(self) -> bool:
         """Check if onboarding info is complete (Gap 4b).
@@ -371,17 +377,7 @@ class AgentLoop:
             return False  # already done, skip
 
         profile = self.user_model.project_profile()
-        constraints = profile.get("constraints", {})
-
-        required = [
-            bool(profile.get("name") and profile.get("name") != "Athlete"),
-            bool(profile.get("sports")),
-            bool(profile.get("goal", {}).get("event")),
-            bool(constraints.get("training_days_per_week")),
-            bool(constraints.get("max_session_minutes")),
-        ]
-
-        if all(required):
+        if all(check(_profile_value(profile, path)) for path, check in _ONBOARDING_REQUIRED):
             self.user_model.meta = {**self.user_model.meta, "_onboarding_complete": True}
             self.user_model.save()
             logger.info("ONBOARDING COMPLETE: All required profile fields gathered.")
@@ -901,3 +897,13 @@ def _drain_sync_queue(sync_queue: queue.Queue) -> None:
             sync_queue.get_nowait()
         except queue.Empty:
             break
+
+
+def _profile_value(profile: dict, path: str) -> object:
+    """Look up a dotted path (e.g. ``"goal.event"``) in a projected profile."""
+    value: object = profile
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
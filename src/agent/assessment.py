@@ -5,6 +5,7 @@ import re
 
 from src.agent.json_utils import extract_json
 from src.agent.llm import chat_completion
+from src.agent.prompts import _format_beliefs_section
 
 ASSESSMENT_SYSTEM_PROMPT = """\
 You are an expert endurance sports coach analyzing an athlete's training data.
@@ -96,7 +97,6 @@ def _format_conversation_context(
         )
 
     if beliefs:
-        from src.agent.prompts import _format_beliefs_section
         beliefs_text = _format_beliefs_section(beliefs)
         if beliefs_text:
             sections.append(beliefs_text.strip())
@@ -117,12 +117,11 @@ def _build_assessment_prompt(
 
     # Summarize prescribed sessions
     prescribed = plan.get("sessions", [])
-    prescribed_summary = []
-    for s in prescribed:
-        prescribed_summary.append(
-            f"  - {s.get('day', '?')}: {s.get('sport', '?')} {s.get('type', '?')} "
-            f"({s.get('duration_minutes', '?')}min)"
-        )
+    prescribed_summary = [
+        f"  - {s.get('day', '?')}: {s.get('sport', '?')} {s.get('type', '?')} "
+        f"({s.get('duration_minutes', '?')}min)"
+        for s in prescribed
+    ]
 
     # Summarize actual activities
     actual_summary = []
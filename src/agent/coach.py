@@ -1,6 +1,7 @@
 """Training coach agent: generates weekly plans via LiteLLM."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -53,3 +54,23 @@ def save_plan(plan: dict) -> Path:
     path = PLANS_DIR / f"plan_{timestamp}.json"
     path.write_text(json.dumps(plan, indent=2))
     return path
+
+
+def latest_plan_path(plans_dir: Path = PLANS_DIR) -> Path | None:
+    """Return the newest ``plan_*.json`` in plans_dir, or None if there is none.
+
+    Plan filenames embed a sortable timestamp, so a single scandir pass
+    keeping the max name is enough -- no glob, no full sort.
+    """
+    try:
+        entries = os.scandir(plans_dir)
+    except FileNotFoundError:
+        return None
+
+    latest = None
+    with entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("plan_") and name.endswith(".json") and (latest is None or name > latest):
+                latest = name
+    return Path(plans_dir) / latest if latest else None
@@ -3,6 +3,11 @@
 import json
 import re
 
+# Compiled once: extract_json runs on every structured LLM response.
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*\n?")
+_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
 
 def extract_json(text: str) -> dict:
     """Extract a JSON object from LLM response text.
@@ -20,8 +25,8 @@ def extract_json(text: str) -> dict:
 
     # Strip markdown code fences
     if text.startswith("```"):
-        text = re.sub(r"^```(?:json)?\s*\n?", "", text)
-        text = re.sub(r"\n?```\s*$", "", text)
+        text = _FENCE_OPEN_RE.sub("", text)
+        text = _FENCE_CLOSE_RE.sub("", text)
         text = text.strip()
 
     # Try direct parse first
@@ -61,9 +66,7 @@ def extract_json(text: str) -> dict:
 def _fix_trailing_commas(text: str) -> str:
     """Remove trailing commas before closing braces/brackets."""
     # ,} -> }   and ,] -> ]
-    text = re.sub(r",\s*}", "}", text)
-    text = re.sub(r",\s*]", "]", text)
-    return text
+    return _TRAILING_COMMA_RE.sub(r"\1", text)
 
 
 def _fix_missing_braces(text: str) -> str:
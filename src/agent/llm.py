@@ -7,11 +7,18 @@ Provides:
     - test_connection(): Quick connectivity check
 """
 
+from __future__ import annotations
+
 import os
 import logging
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import litellm
-from google import genai
+
+if TYPE_CHECKING:
+    # Imported lazily in _client_for_key: only the embedding path needs it.
+    from google import genai
 
 logger = logging.getLogger(__name__)
 
@@ -74,14 +81,22 @@ def chat_completion(
 
 
 def get_client() -> genai.Client:
-    """Create a Gemini client for embedding operations.
+    """Return the shared Gemini client for embedding operations.
 
     Retained for backward compatibility -- used by user_model.py for
     embed_content() calls. All chat/generation should use chat_completion().
+    One client is kept per API key so its pooled connections are reused.
     """
     api_key = os.environ.get("GEMINI_API_KEY")
     if not api_key:
         raise ValueError("GEMINI_API_KEY not set in environment")
+    return _client_for_key(api_key)
+
+
+@lru_cache(maxsize=1)
+def _client_for_key(api_key: str) -> genai.Client:
+    from google import genai
+
     return genai.Client(api_key=api_key)
 
 
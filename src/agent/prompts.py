@@ -206,6 +206,12 @@ def _format_session_schemas(schemas: list[dict]) -> str:
     return "\n".join(lines)
 
 
+# The no-schema prompt never varies, so format it once at import.
+_GENERIC_COACH_SYSTEM_PROMPT = _COACH_SYSTEM_PROMPT_TEMPLATE.format(
+    session_schema_section=_GENERIC_SESSION_SCHEMA_SECTION,
+)
+
+
 def build_coach_system_prompt(user_id: str) -> str:
     """Build the coach system prompt with session schemas loaded from DB.
 
@@ -223,12 +229,12 @@ def build_coach_system_prompt(user_id: str) -> str:
         logger.warning("Failed to load session_schemas for user %s, using generic section", user_id)
         schemas = []
 
-    if schemas:
-        session_section = _format_session_schemas(schemas)
-    else:
-        session_section = _GENERIC_SESSION_SCHEMA_SECTION
+    if not schemas:
+        return _GENERIC_COACH_SYSTEM_PROMPT
 
-    return _COACH_SYSTEM_PROMPT_TEMPLATE.format(session_schema_section=session_section)
+    return _COACH_SYSTEM_PROMPT_TEMPLATE.format(
+        session_schema_section=_format_session_schemas(schemas),
+    )
 
 
 GREETING_SYSTEM_PROMPT = """\
@@ -302,6 +308,20 @@ Rules for the weeks array:
 """
 
 
+def _format_fitness_info(fitness: dict) -> str:
+    """Format known fitness markers as newline-terminated prompt lines."""
+    lines = []
+    if fitness.get("estimated_vo2max"):
+        lines.append(f"- Estimated VO2max: {fitness['estimated_vo2max']}")
+    if fitness.get("threshold_pace_min_km"):
+        lines.append(f"- Threshold pace: {fitness['threshold_pace_min_km']} min/km")
+    if fitness.get("weekly_volume_km"):
+        lines.append(f"- Current weekly volume: {fitness['weekly_volume_km']} km")
+    if not lines:
+        lines.append("- No fitness data available (assume beginner/unknown level)")
+    return "\n".join(lines) + "\n"
+
+
 def build_macrocycle_prompt(
     profile: dict,
     total_weeks: int,
@@ -325,15 +345,7 @@ def build_macrocycle_prompt(
     fitness = profile.get("fitness", {})
     sports = profile.get("sports", [])
 
-    fitness_info = ""
-    if fitness.get("estimated_vo2max"):
-        fitness_info += f"- Estimated VO2max: {fitness['estimated_vo2max']}\n"
-    if fitness.get("threshold_pace_min_km"):
-        fitness_info += f"- Threshold pace: {fitness['threshold_pace_min_km']} min/km\n"
-    if fitness.get("weekly_volume_km"):
-        fitness_info += f"- Current weekly volume: {fitness['weekly_volume_km']} km\n"
-    if not fitness_info:
-        fitness_info = "- No fitness data available (assume beginner/unknown level)\n"
+    fitness_info = _format_fitness_info(fitness)
 
     beliefs_section = _format_beliefs_section(beliefs)
 
@@ -442,15 +454,7 @@ def build_plan_prompt(
     fitness = profile.get("fitness", {})
     sports = profile.get("sports", [])
 
-    fitness_info = ""
-    if fitness.get("estimated_vo2max"):
-        fitness_info += f"- Estimated VO2max: {fitness['estimated_vo2max']}\n"
-    if fitness.get("threshold_pace_min_km"):
-        fitness_info += f"- Threshold pace: {fitness['threshold_pace_min_km']} min/km\n"
-    if fitness.get("weekly_volume_km"):
-        fitness_info += f"- Current weekly volume: {fitness['weekly_volume_km']} km\n"
-    if not fitness_info:
-        fitness_info = "- No fitness data available (assume beginner/unknown level)\n"
+    fitness_info = _format_fitness_info(fitness)
 
     # Activity data injection for data-derived targets
     activity_section = ""
@@ -487,6 +491,7 @@ def build_plan_prompt(
                 ep_lines.append(f"  - Pattern: {pattern}")
         episodes_section = "\n".join(ep_lines) + "\n"
 
+    today = date.today()
     return f"""\
 Create a 1-week training plan for this athlete:
 
@@ -502,6 +507,6 @@ Target time: {goal.get('target_time', 'Not set')}
 - Max session duration: {constraints.get('max_session_minutes', 90)} minutes
 - Available sports: {', '.join(constraints.get('available_sports', sports))}
 {episodes_section}{beliefs_section}
-TODAY'S DATE: {date.today().isoformat()} ({date.today().strftime('%A')})
+TODAY'S DATE: {today.isoformat()} ({today.strftime('%A')})
 Generate the plan starting from the next Monday after today.
 """
@@ -414,26 +414,35 @@ def _apply_meta_beliefs(
 ) -> list[dict]:
     """Apply meta-beliefs from extract_meta_beliefs to user model.
 
-    For each meta-belief: call user_model.add_belief() with category="meta".
+    All meta-beliefs are stored with one user_model.add_beliefs() call
+    (category="meta"). If that raises, each belief is retried on its own
+    with add_belief(), skipping the ones that still fail.
     Returns list of applied belief dicts.
     """
-    applied = []
     ep_id = episode.get("id", "unknown")
+    specs = [
+        {
+            "text": mb["text"],
+            "category": "meta",
+            "confidence": mb.get("confidence", 0.7),
+            "source": "reflection",
+            "source_ref": ep_id,
+        }
+        for mb in meta_beliefs
+        if mb.get("text")
+    ]
+    if not specs:
+        return []
 
-    for mb in meta_beliefs:
-        text = mb.get("text", "")
-        if not text:
-            continue
-        confidence = mb.get("confidence", 0.7)
+    try:
+        return user_model.add_beliefs(specs)
+    except Exception as exc:
+        log.warning("Failed to add meta-beliefs in bulk, retrying one by one: %s", exc)
+
+    applied = []
+    for spec in specs:
         try:
-            belief = user_model.add_belief(
-                text=text,
-                category="meta",
-                confidence=confidence,
-                source="reflection",
-                source_ref=ep_id,
-            )
-            applied.append(belief)
+            applied.append(user_model.add_belief(**spec))
         except Exception as exc:
             log.warning("Failed to add meta-belief: %s", exc)
 
@@ -11,6 +11,8 @@ import json
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from src.agent.coach import latest_plan_path
+
 
 def build_startup_context(user_model, imported: list | None = None) -> str:
     """Build pre-computed context for the agent's first turn.
@@ -84,17 +86,15 @@ def build_startup_context(user_model, imported: list | None = None) -> str:
         parts.append(f"New imports: {len(imported)} activities just imported from FIT files")
 
     # -- Plan compliance --
-    plans_dir = Path("data/plans")
-    if plans_dir.exists():
-        plan_files = sorted(plans_dir.glob("plan_*.json"), reverse=True)
-        if plan_files:
-            try:
-                latest_plan = json.loads(plan_files[0].read_text())
-                sessions_planned = len(latest_plan.get("sessions", []))
-                phase = latest_plan.get("training_phase", "unknown")
-                parts.append(f"Active plan: {sessions_planned} sessions/week, phase: {phase}")
-            except (json.JSONDecodeError, OSError):
-                pass
+    plan_file = latest_plan_path(Path("data/plans"))
+    if plan_file is not None:
+        try:
+            latest_plan = json.loads(plan_file.read_text())
+            sessions_planned = len(latest_plan.get("sessions", []))
+            phase = latest_plan.get("training_phase", "unknown")
+            parts.append(f"Active plan: {sessions_planned} sessions/week, phase: {phase}")
+        except (json.JSONDecodeError, OSError):
+            pass
 
     # -- Belief count --
     beliefs = user_model.get_active_beliefs()
@@ -14,8 +14,12 @@ evaluation criteria) at runtime via Agent Config Store tools. The system prompt
 is a blank slate -- a generalist coach that learns everything via tools.
 """
 
+import logging
+import weakref
 from datetime import date as _date_cls
 
+logger = logging.getLogger(__name__)
+
 
 # ---------------------------------------------------------------------------
 # 1. STATIC SYSTEM PROMPT -- NO f-strings, NO runtime data, NO sport-specific knowledge
@@ -494,6 +498,18 @@ After first health data sync:
 - If the athlete asks coaching questions during onboarding, answer them AND continue gathering info
 """
 
+# Token budgets for the runtime context block, per session context.
+# Sections beyond the budget are dropped lowest-priority first.
+RUNTIME_CONTEXT_TOKEN_BUDGETS = {
+    "coach": 6000,
+    "onboarding": 6000,
+}
+
+_REQUIRED = 0  # Section priority that is never dropped
+
+# user model -> (core_version, rendered profile, missing onboarding fields)
+_PROFILE_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
 
 def build_runtime_context(
     user_model,
@@ -518,52 +534,23 @@ def build_runtime_context(
 
     Returns:
         A formatted string to be injected as the first user-role message.
+        Optional sections that would exceed RUNTIME_CONTEXT_TOKEN_BUDGETS
+        are left out (date, profile and onboarding sections always stay).
     """
     today = date or _date_cls.today().isoformat()
     weekday = _date_cls.fromisoformat(today).strftime("%A")
 
-    profile = user_model.project_profile()
-    athlete_name = profile.get("name") or "Unknown"
-    sports = profile.get("sports") or []
-    sports_str = ", ".join(sports) if sports else "Not yet known"
+    profile_text, onboarding_missing = _profile_block(user_model)
 
-    # Optional sub-sections -- only emit if data is present
-    sections: list[str] = []
+    # Optional sub-sections -- only emit if data is present.
+    # Each entry is (name, priority, token_estimate, text); see _pack_sections.
+    sections: list[tuple[str, int, int, str]] = []
 
     # --- Date ---
-    sections.append(f"# Current Date\nToday is {today} ({weekday}).")
+    sections.append(_section("date", _REQUIRED, f"# Current Date\nToday is {today} ({weekday})."))
 
     # --- Athlete Profile ---
-    profile_lines = [
-        f"# Current Athlete",
-        f"Name: {athlete_name}",
-        f"Sports: {sports_str}",
-    ]
-
-    goal_event = profile.get("goal", {}).get("event") if isinstance(profile.get("goal"), dict) else None
-    goal_date = profile.get("goal", {}).get("target_date") if isinstance(profile.get("goal"), dict) else None
-    if goal_event:
-        profile_lines.append(f"Goal: {goal_event}" + (f" on {goal_date}" if goal_date else ""))
-
-    constraints = profile.get("constraints") or {}
-    if isinstance(constraints, dict):
-        train_days = constraints.get("training_days_per_week")
-        max_minutes = constraints.get("max_session_minutes")
-        if train_days is not None:
-            profile_lines.append(f"Training days per week: {train_days}")
-        if max_minutes is not None:
-            profile_lines.append(f"Max session duration: {max_minutes} min")
-
-    fitness = profile.get("fitness") or {}
-    if isinstance(fitness, dict):
-        vo2max = fitness.get("estimated_vo2max")
-        threshold_pace = fitness.get("threshold_pace_min_km")
-        if vo2max is not None:
-            profile_lines.append(f"Estimated VO2max: {vo2max}")
-        if threshold_pace is not None:
-            profile_lines.append(f"Threshold pace: {threshold_pace} min/km")
-
-    sections.append("\n".join(profile_lines))
+    sections.append(_section("profile", _REQUIRED, profile_text))
 
     # --- Active Beliefs ---
     try:
@@ -580,7 +567,7 @@ def build_runtime_context(
             conf_str = f" (confidence: {confidence})" if confidence is not None else ""
             cat_str = f" [{category}]" if category else ""
             belief_lines.append(f"- {text}{cat_str}{conf_str}")
-        sections.append("\n".join(belief_lines))
+        sections.append(_section("beliefs", 2, "\n".join(belief_lines)))
 
     # --- Training Plan Summary ---
     try:
@@ -589,7 +576,7 @@ def build_runtime_context(
         plan_summary = None
 
     if plan_summary:
-        sections.append(f"# Active Training Plan\n{plan_summary}")
+        sections.append(_section("plan", 1, f"# Active Training Plan\n{plan_summary}"))
 
     # --- Multi-Sport Load Summary (All Sources) ---
     try:
@@ -624,7 +611,7 @@ def build_runtime_context(
                         "\n\n## Per-Sport Breakdown\n"
                         + "\n".join(sport_lines)
                     )
-                sections.append(load_header)
+                sections.append(_section("load", 4, load_header))
     except Exception:
         pass  # Non-critical -- do not crash context building
 
@@ -640,36 +627,38 @@ def build_runtime_context(
             )
             health_summary = build_health_summary(_uid_r, days=7)
             if health_summary and health_summary["data_available"]:
-                sections.append(format_recovery_context_block(health_summary))
+                sections.append(_section("recovery", 3, format_recovery_context_block(health_summary)))
     except Exception:
         pass  # Non-critical -- do not crash context building
 
     # --- Onboarding State ---
-    onboarding_missing = _onboarding_missing(profile)
     if onboarding_missing:
         missing_str = ", ".join(onboarding_missing)
-        sections.append(
+        sections.append(_section(
+            "onboarding_state", _REQUIRED,
             f"# Onboarding State\n"
             f"This athlete is still being onboarded. Missing: {missing_str}.\n"
             f"Gather these naturally in conversation and save them with update_profile()."
-        )
+        ))
 
     # --- Startup Context (pre-loaded by CLI) ---
     if startup_context:
-        sections.append(
+        sections.append(_section(
+            "startup", 1,
             f"# Pre-Loaded Session Context\n"
             f"{startup_context}\n"
             f"Use this context to inform your greeting and coaching.\n"
             f"You SHOULD still call update_profile() and add_belief() for any NEW information\n"
             f"the athlete shares -- this context only saves you from calling data-retrieval\n"
             f"tools like get_activities() or get_athlete_profile() at session start."
-        )
+        ))
 
     # --- Onboarding Mode Instructions ---
     if context == "onboarding":
-        sections.append(ONBOARDING_MODE_INSTRUCTIONS)
+        sections.append(_section("onboarding_mode", _REQUIRED, ONBOARDING_MODE_INSTRUCTIONS))
 
-    return "\n\n".join(sections)
+    budget = RUNTIME_CONTEXT_TOKEN_BUDGETS.get(context, RUNTIME_CONTEXT_TOKEN_BUDGETS["coach"])
+    return _pack_sections(sections, budget)
 
 
 # ---------------------------------------------------------------------------
@@ -699,6 +688,102 @@ def build_system_prompt(
 # Private helpers
 # ---------------------------------------------------------------------------
 
+def _section(name: str, priority: int, text: str) -> tuple[str, int, int, str]:
+    """Build a runtime-context section entry with a rough token estimate (~4 chars/token)."""
+    return (name, priority, len(text) // 4, text)
+
+
+def _pack_sections(sections: list[tuple[str, int, int, str]], budget: int) -> str:
+    """Select sections by priority until the token budget is used, then join once.
+
+    Required sections are always kept. Optional sections are admitted in
+    priority order (lower number first) while they fit; the kept sections
+    are emitted in their original order so the context reads the same.
+    """
+    used = sum(tokens for _, prio, tokens, _ in sections if prio == _REQUIRED)
+    keep = [prio == _REQUIRED for _, prio, _, _ in sections]
+
+    optional = sorted(
+        (i for i, (_, prio, _, _) in enumerate(sections) if prio != _REQUIRED),
+        key=lambda i: sections[i][1],
+    )
+    for i in optional:
+        name, _, tokens, _ = sections[i]
+        if used + tokens <= budget:
+            keep[i] = True
+            used += tokens
+        else:
+            logger.info("Runtime context over budget -- dropped section %r (~%d tokens)", name, tokens)
+
+    return "\n\n".join(text for (_, _, _, text), kept in zip(sections, keep) if kept)
+
+
+def _profile_block(user_model) -> tuple[str, list[str]]:
+    """Return the rendered profile section and missing onboarding fields.
+
+    The result only depends on ``structured_core``, so it is cached per user
+    model and reused until ``core_version`` changes. Models without a
+    version counter are rendered every call.
+    """
+    version = getattr(user_model, "core_version", None)
+    if isinstance(version, int):
+        try:
+            cached = _PROFILE_CACHE.get(user_model)
+        except TypeError:
+            cached = None
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+    profile = user_model.project_profile()
+    text = _render_profile(profile)
+    missing = _onboarding_missing(profile)
+
+    if isinstance(version, int):
+        try:
+            _PROFILE_CACHE[user_model] = (version, text, missing)
+        except TypeError:
+            pass
+    return text, missing
+
+
+def _render_profile(profile: dict) -> str:
+    """Format the ``# Current Athlete`` section from a projected profile."""
+    athlete_name = profile.get("name") or "Unknown"
+    sports = profile.get("sports") or []
+    sports_str = ", ".join(sports) if sports else "Not yet known"
+
+    profile_lines = [
+        f"# Current Athlete",
+        f"Name: {athlete_name}",
+        f"Sports: {sports_str}",
+    ]
+
+    goal_event = profile.get("goal", {}).get("event") if isinstance(profile.get("goal"), dict) else None
+    goal_date = profile.get("goal", {}).get("target_date") if isinstance(profile.get("goal"), dict) else None
+    if goal_event:
+        profile_lines.append(f"Goal: {goal_event}" + (f" on {goal_date}" if goal_date else ""))
+
+    constraints = profile.get("constraints") or {}
+    if isinstance(constraints, dict):
+        train_days = constraints.get("training_days_per_week")
+        max_minutes = constraints.get("max_session_minutes")
+        if train_days is not None:
+            profile_lines.append(f"Training days per week: {train_days}")
+        if max_minutes is not None:
+            profile_lines.append(f"Max session duration: {max_minutes} min")
+
+    fitness = profile.get("fitness") or {}
+    if isinstance(fitness, dict):
+        vo2max = fitness.get("estimated_vo2max")
+        threshold_pace = fitness.get("threshold_pace_min_km")
+        if vo2max is not None:
+            profile_lines.append(f"Estimated VO2max: {vo2max}")
+        if threshold_pace is not None:
+            profile_lines.append(f"Threshold pace: {threshold_pace} min/km")
+
+    return "\n".join(profile_lines)
+
+
 def _onboarding_missing(profile: dict) -> list[str]:
     """Return a list of onboarding fields that are still missing."""
     missing = []
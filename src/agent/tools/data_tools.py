@@ -167,16 +167,14 @@ def register_data_tools(registry: ToolRegistry, user_model):
         else:
             from pathlib import Path
             import json
-            plans_dir = Path("data/plans")
-            if not plans_dir.exists():
-                return {"plan": None, "message": "No training plans exist yet."}
-            plan_files = sorted(plans_dir.glob("plan_*.json"), reverse=True)
-            if not plan_files:
+            from src.agent.coach import latest_plan_path
+            plan_file = latest_plan_path(Path("data/plans"))
+            if plan_file is None:
                 return {"plan": None, "message": "No training plans exist yet."}
-            latest = json.loads(plan_files[0].read_text())
+            latest = json.loads(plan_file.read_text())
             return {
                 "plan": latest,
-                "file": str(plan_files[0]),
+                "file": str(plan_file),
                 "sessions_count": len(latest.get("sessions", [])),
                 "training_phase": latest.get("training_phase", "unknown"),
             }
@@ -81,6 +81,9 @@ def _search_sessions(user_id: str, query: str, limit: int) -> list[dict]:
     Searches the ``compressed_summary`` column (and ``tags`` when present)
     for the given query string.  Results are ordered newest-first.
 
+    In file mode (``use_supabase=False``) the local session manifest is
+    searched instead -- see ``src.memory.session_index``.
+
     Args:
         user_id: Owning user UUID.
         query: Search term (will be wrapped in ``%…%``).
@@ -89,6 +92,12 @@ def _search_sessions(user_id: str, query: str, limit: int) -> list[dict]:
     Returns:
         List of result dicts with keys: session_id, date, summary, tags.
     """
+    from src.config import get_settings
+
+    if not get_settings().use_supabase:
+        from src.memory.session_index import search_sessions
+        return search_sessions(query, limit=limit)
+
     from src.db.client import get_supabase
 
     db = get_supabase()
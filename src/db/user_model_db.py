@@ -97,6 +97,9 @@ class UserModelDB:
             "sessions_completed": 0,
             "last_interaction": None,
         }
+        # Bumped on every structured_core write; lets prompt builders reuse
+        # the rendered profile until it actually changes.
+        self.core_version = 0
 
     # ── Loading / Persistence ────────────────────────────────────
 
@@ -174,6 +177,7 @@ class UserModelDB:
 
     def _from_profile_row(self, row: dict) -> None:
         """Populate structured_core and meta from a profiles table row."""
+        self.core_version += 1
         self.structured_core["name"] = row.get("name")
         self.structured_core["sports"] = row.get("sports") or []
 
@@ -306,10 +310,9 @@ class UserModelDB:
             "outcome_history": [],
         }
 
-    # ── Belief CRUD ──────────────────────────────────────────────
-
-    def add_belief(
-        self,
+    @staticmethod
+    def _belief_spec(
+        *,
         text: str,
         category: str,
         confidence: float = 0.7,
@@ -321,30 +324,42 @@ class UserModelDB:
         valid_until: str | None = None,
         embedding: list[float] | None = None,
     ) -> dict:
+        """Fill in the ``add_belief()`` defaults; returns ``_to_belief_insert`` kwargs.
+
+        The single home of those defaults, shared by the single and batch paths.
+        """
+        return {
+            "text": text,
+            "category": category,
+            "confidence": confidence,
+            "source": source,
+            "source_ref": source_ref,
+            "durability": durability,
+            "stability": stability,
+            "valid_from": valid_from,
+            "valid_until": valid_until,
+            "embedding": embedding,
+        }
+
+    # ── Belief CRUD ──────────────────────────────────────────────
+
+    def add_belief(self, text: str, category: str, **options) -> dict:
         """Create a new belief and persist it to Supabase immediately.
 
-        If *embedding* is ``None`` an embedding is generated via Gemini
-        automatically (failure is non-fatal -- the belief is stored without one).
+        *options* are the optional ``_belief_spec()`` fields (confidence,
+        source, source_ref, durability, stability, valid_from, valid_until,
+        embedding).  If *embedding* is ``None`` an embedding is generated via
+        Gemini automatically (failure is non-fatal -- the belief is stored
+        without one).
 
         Returns the belief dict (same shape as ``UserModel.add_belief``).
         """
+        spec = self._belief_spec(text=text, category=category, **options)
         # Generate embedding if not provided
-        if embedding is None:
-            embedding = self._generate_embedding(text)
-
-        row = self._to_belief_insert(
-            user_id=self.user_id,
-            text=text,
-            category=category,
-            confidence=confidence,
-            stability=stability,
-            durability=durability,
-            source=source,
-            source_ref=source_ref,
-            valid_from=valid_from,
-            valid_until=valid_until,
-            embedding=embedding,
-        )
+        if spec["embedding"] is None:
+            spec["embedding"] = self._generate_embedding(text)
+
+        row = self._to_belief_insert(user_id=self.user_id, **spec)
 
         try:
             result = self._db.table("beliefs").insert(row).execute()
@@ -356,15 +371,15 @@ class UserModelDB:
                 "id": str(uuid.uuid4()),
                 "text": text,
                 "category": category if category in BELIEF_CATEGORIES else "preference",
-                "confidence": max(0.0, min(1.0, confidence)),
-                "stability": stability,
-                "durability": durability,
-                "source": source,
-                "source_ref": source_ref,
+                "confidence": max(0.0, min(1.0, spec["confidence"])),
+                "stability": spec["stability"],
+                "durability": spec["durability"],
+                "source": spec["source"],
+                "source_ref": spec["source_ref"],
                 "first_observed": _now_iso(),
                 "last_confirmed": _now_iso(),
-                "valid_from": valid_from or _today_iso(),
-                "valid_until": valid_until,
+                "valid_from": spec["valid_from"] or _today_iso(),
+                "valid_until": spec["valid_until"],
                 "learned_at": _now_iso(),
                 "archived_at": None,
                 "active": True,
@@ -380,6 +395,38 @@ class UserModelDB:
         self.meta["updated_at"] = _now_iso()
         return belief
 
+    def add_beliefs(self, beliefs: list[dict]) -> list[dict]:
+        """Create several beliefs with a single Supabase INSERT.
+
+        Each dict holds ``add_belief()`` keyword arguments.  Missing
+        embeddings are generated first.  If the batch insert fails, falls
+        back to ``add_belief()`` per belief so each one still gets stored
+        (or an in-memory stand-in).
+
+        Returns the created belief dicts in input order.
+        """
+        specs = [self._belief_spec(**belief) for belief in beliefs]
+        if not specs:
+            return []
+        for spec in specs:
+            if spec["embedding"] is None:
+                spec["embedding"] = self._generate_embedding(spec["text"])
+
+        rows = [self._to_belief_insert(user_id=self.user_id, **spec) for spec in specs]
+
+        try:
+            result = self._db.table("beliefs").insert(rows).execute()
+            created = [self._from_belief_row(row) for row in result.data]
+        except Exception:
+            logger.exception(
+                "Batch belief insert failed for user %s; inserting one by one", self.user_id
+            )
+            return [self.add_belief(**spec) for spec in specs]
+
+        self.beliefs.extend(created)
+        self.meta["updated_at"] = _now_iso()
+        return created
+
     def update_belief(
         self,
         belief_id: str,
@@ -471,16 +518,12 @@ class UserModelDB:
         min_confidence: float = 0.0,
     ) -> list[dict]:
         """Retrieve active beliefs from the in-memory cache, optionally filtered."""
-        results = []
-        for b in self.beliefs:
-            if not b["active"]:
-                continue
-            if category and b["category"] != category:
-                continue
-            if b["confidence"] < min_confidence:
-                continue
-            results.append(b)
-        return results
+        return [
+            b for b in self.beliefs
+            if b["active"]
+            and (not category or b["category"] == category)
+            and b["confidence"] >= min_confidence
+        ]
 
     # ── Outcome Recording (P6: active memory) ───────────────────
 
@@ -722,6 +765,26 @@ class UserModelDB:
 
         The profile is persisted to Supabase automatically.
         """
+        self._set_core_field(field_path, value)
+
+        # Auto-persist to DB so callers do not need to remember to call save().
+        self.save()
+
+    def update_structured_core_bulk(self, updates: dict) -> None:
+        """Apply several dot-notation updates, then persist the profile once.
+
+        Example::
+
+            model.update_structured_core_bulk({"name": "Lena", "goal.event": "10K"})
+        """
+        if not updates:
+            return
+        for field_path, value in updates.items():
+            self._set_core_field(field_path, value)
+        self.save()
+
+    def _set_core_field(self, field_path: str, value) -> None:
+        """Set one dot-notation field in memory without persisting."""
         parts = field_path.split(".")
         target = self.structured_core
         for part in parts[:-1]:
@@ -729,11 +792,9 @@ class UserModelDB:
                 target[part] = {}
             target = target[part]
         target[parts[-1]] = value
+        self.core_version += 1
         self.meta["updated_at"] = _now_iso()
 
-        # Auto-persist to DB so callers do not need to remember to call save().
-        self.save()
-
     # ── User Model Summary (for prompt injection) ────────────────
 
     def get_model_summary(self) -> str:
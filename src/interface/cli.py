@@ -1,6 +1,7 @@
 """CLI interface for AgenticSports using Rich."""
 
 import argparse
+import json
 from pathlib import Path
 
 from rich.console import Console
@@ -9,11 +10,12 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.markup import escape
 
-from src.agent.coach import generate_plan, save_plan
+from src.agent.coach import generate_plan, latest_plan_path, save_plan
 from src.agent.proactive import check_proactive_triggers, format_proactive_message
 from src.agent.trajectory import assess_trajectory
 from src.config import get_settings
 from src.memory.episodes import list_episodes as list_episodes_file
+from src.memory.episodes import retrieve_relevant_episodes
 from src.memory.profile import create_profile, save_profile, load_profile
 from src.memory.user_model import UserModel
 from src.tools.fit_parser import parse_fit_file
@@ -323,12 +325,10 @@ def run_assessment() -> None:
 
 def _load_latest_plan() -> dict | None:
     """Load the most recent training plan from data/plans/."""
-    import json as _json
-    plans_dir = Path(__file__).parent.parent.parent / "data" / "plans"
-    plan_files = sorted(plans_dir.glob("plan_*.json")) if plans_dir.exists() else []
-    if not plan_files:
+    plan_file = latest_plan_path()
+    if plan_file is None:
         return None
-    return _json.loads(plan_files[-1].read_text())
+    return json.loads(plan_file.read_text())
 
 
 def run_trajectory() -> None:
@@ -447,7 +447,6 @@ def _run_chat() -> None:
     Includes: startup optimization, plan display, import awareness,
     and proactive session-start analysis.
     """
-    import json as _json
     from src.agent.agent_loop import AgentLoop
     from src.agent.startup_context import build_startup_context
 
@@ -523,13 +522,13 @@ def _run_chat() -> None:
         for turn in result.turns:
             if turn.tool_name == "save_plan" and turn.content:
                 try:
-                    save_result = _json.loads(turn.content)
+                    save_result = json.loads(turn.content)
                     if save_result.get("saved"):
                         plan_path = save_result.get("path")
                         if plan_path:
-                            plan_data = _json.loads(Path(plan_path).read_text())
+                            plan_data = json.loads(Path(plan_path).read_text())
                             display_plan(plan_data)
-                except (_json.JSONDecodeError, OSError, KeyError):
+                except (json.JSONDecodeError, OSError, KeyError):
                     pass
 
         # Show tool usage stats
@@ -548,8 +547,12 @@ def _run_chat() -> None:
     user_model.save()
 
 
-def main(args: list[str] | None = None):
-    """Main CLI entry point with argument parsing."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser.
+
+    Kept separate from main() so callers that parse many argument lists
+    (e.g. tests) can construct it once and reuse it.
+    """
     parser = argparse.ArgumentParser(
         prog="agenticsports",
         description="AgenticSports - Autonomous AI Sports Coach",
@@ -578,8 +581,12 @@ def main(args: list[str] | None = None):
         "--onboard-legacy", action="store_true",
         help="Use legacy form-based onboarding (deprecated)",
     )
+    return parser
 
-    parsed = parser.parse_args(args)
+
+def main(args: list[str] | None = None):
+    """Main CLI entry point with argument parsing."""
+    parsed = build_parser().parse_args(args)
 
     if parsed.import_file:
         import_activity(parsed.import_file)
@@ -603,7 +610,6 @@ def main(args: list[str] | None = None):
         console.print("\n[yellow]Generating your training plan...[/yellow]\n")
         _, list_acts_fn, list_eps_fn = _get_backends()
         activities = list_acts_fn()
-        from src.memory.episodes import retrieve_relevant_episodes
         _episodes = list_eps_fn(limit=10)
         _relevant_eps = retrieve_relevant_episodes(
             {"goal": profile.get("goal", {}), "sports": profile.get("sports", [])},
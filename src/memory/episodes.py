@@ -1,6 +1,10 @@
 """Episodic memory: generate, store, and retrieve training reflections."""
 
+import asyncio
+import copy
+import hashlib
 import json
+import logging
 import re
 from datetime import datetime
 from pathlib import Path
@@ -8,6 +12,8 @@ from pathlib import Path
 from src.agent.json_utils import extract_json
 from src.agent.llm import chat_completion
 
+logger = logging.getLogger(__name__)
+
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 EPISODES_DIR = DATA_DIR / "episodes"
 
@@ -282,26 +288,24 @@ Rules:
 """
 
 
-def extract_meta_beliefs(episode: dict) -> list[dict]:
-    """Extract meta-beliefs about coaching effectiveness from a reflection episode.
+# Static lead-in for the meta-reflection user message. Episode data is
+# appended after it so the system prompt plus this prefix stay byte-identical
+# across calls and can be served from provider prompt caches.
+_META_USER_PREFIX = """\
+Based on the reflection below, what coaching insights should I remember for future plans and conversations with this athlete?
 
-    Meta-beliefs capture the agent's self-evaluation of its coaching decisions.
-    They are stored as regular beliefs with category="meta" and influence
-    future behavior through the PrefEval injection pattern.
+EPISODE:
+"""
 
-    Args:
-        episode: A completed reflection episode dict.
 
-    Returns:
-        List of meta-belief dicts with text, category, confidence, reasoning.
-    """
-    # Build context from the episode
+def _build_meta_reflection_prompt(episode: dict) -> str:
+    """Build the user prompt for meta-belief extraction from an episode."""
     observations = episode.get("key_observations", [])
     lessons = episode.get("lessons", [])
     patterns = episode.get("patterns_detected", [])
     compliance = episode.get("compliance_rate", "?")
 
-    prompt = f"""\
+    return _META_USER_PREFIX + f"""\
 TRAINING BLOCK: {episode.get('block', 'unknown')}
 COMPLIANCE: {compliance}
 
@@ -313,21 +317,141 @@ LESSONS LEARNED:
 
 PATTERNS DETECTED:
 {chr(10).join(f'  - {p}' for p in patterns) if patterns else '  None'}
-
-Based on this reflection, what coaching insights should I remember for future plans and conversations with this athlete?
 """
 
-    response = chat_completion(
-        messages=[{"role": "user", "content": prompt}],
-        system_prompt=META_REFLECTION_PROMPT,
-        temperature=0.4,
-    )
 
+def _parse_meta_beliefs(response) -> list[dict] | None:
+    """Pull the meta_beliefs list out of an LLM response, or None if malformed."""
     try:
         result = extract_json(response.choices[0].message.content)
         return result.get("meta_beliefs", [])
     except (ValueError, AttributeError):
+        return None
+
+
+# Episode fields that give the meta-reflection something to work with.
+_META_SIGNAL_KEYS = ("key_observations", "lessons", "patterns_detected")
+
+
+def _has_meta_signals(episode: dict) -> bool:
+    return any(episode.get(k) for k in _META_SIGNAL_KEYS)
+
+
+# prompt hash -> parsed meta-beliefs, so re-running a reflection on an
+# unchanged episode skips the LLM call. Malformed responses are not cached.
+_META_CACHE: dict[str, list[dict]] = {}
+_META_CACHE_MAX = 256
+
+
+def _meta_cache_key(prompt: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(META_REFLECTION_PROMPT.encode())
+    digest.update(prompt.encode())
+    return digest.hexdigest()
+
+
+def _meta_cache_get(key: str) -> list[dict] | None:
+    cached = _META_CACHE.get(key)
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def _meta_cache_put(key: str, beliefs: list[dict] | None) -> list[dict]:
+    if beliefs is None:
         return []
+    if len(_META_CACHE) >= _META_CACHE_MAX:
+        _META_CACHE.pop(next(iter(_META_CACHE)))
+    _META_CACHE[key] = copy.deepcopy(beliefs)
+    return beliefs
+
+
+def _prepare_meta_request(episode: dict) -> list[dict] | tuple[str, dict]:
+    """Resolve a meta-belief extraction without calling the LLM if possible.
+
+    Returns the beliefs directly when the episode has no signals or the
+    prompt is cached; otherwise (cache key, chat_completion kwargs).
+    """
+    if not _has_meta_signals(episode):
+        return []
+
+    prompt = _build_meta_reflection_prompt(episode)
+    key = _meta_cache_key(prompt)
+    cached = _meta_cache_get(key)
+    if cached is not None:
+        return cached
+
+    return key, {
+        "messages": [{"role": "user", "content": prompt}],
+        "system_prompt": META_REFLECTION_PROMPT,
+        "temperature": 0.4,
+    }
+
+
+def extract_meta_beliefs(episode: dict) -> list[dict]:
+    """Extract meta-beliefs about coaching effectiveness from a reflection episode.
+
+    Meta-beliefs capture the agent's self-evaluation of its coaching decisions.
+    They are stored as regular beliefs with category="meta" and influence
+    future behavior through the PrefEval injection pattern.
+
+    Results are cached by prompt content, so an unchanged episode is only
+    sent to the LLM once per process. Episodes without observations,
+    lessons or patterns return [] without an LLM call.
+
+    Args:
+        episode: A completed reflection episode dict.
+
+    Returns:
+        List of meta-belief dicts with text, category, confidence, reasoning.
+    """
+    request = _prepare_meta_request(episode)
+    if isinstance(request, list):
+        return request
+
+    key, kwargs = request
+    response = chat_completion(**kwargs)
+    return _meta_cache_put(key, _parse_meta_beliefs(response))
+
+
+async def extract_meta_beliefs_async(episode: dict) -> list[dict]:
+    """Async variant of extract_meta_beliefs.
+
+    The blocking LLM call runs in a worker thread so several extractions
+    can overlap their network latency.
+    """
+    request = _prepare_meta_request(episode)
+    if isinstance(request, list):
+        return request
+
+    key, kwargs = request
+    response = await asyncio.to_thread(chat_completion, **kwargs)
+    return _meta_cache_put(key, _parse_meta_beliefs(response))
+
+
+async def extract_meta_beliefs_batch(episodes: list[dict]) -> list[list[dict]]:
+    """Extract meta-beliefs for many episodes concurrently.
+
+    Results are returned in input order. An episode whose LLM call raises
+    an Exception is logged and yields [] like a malformed response does;
+    cancellation and other BaseExceptions propagate.
+    """
+    results = await asyncio.gather(
+        *(extract_meta_beliefs_async(e) for e in episodes),
+        return_exceptions=True,
+    )
+    beliefs: list[list[dict]] = []
+    for episode, result in zip(episodes, results):
+        if isinstance(result, Exception):
+            logger.warning(
+                "Meta-belief extraction failed for episode %s",
+                episode.get("id"),
+                exc_info=result,
+            )
+            beliefs.append([])
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            beliefs.append(result)
+    return beliefs
 
 
 def _extract_keywords(context: dict) -> list[str]:
@@ -0,0 +1,160 @@
+"""File-based session index: append-only manifest of local JSONL transcripts.
+
+In file mode (``use_supabase=False``) every coaching session is written to
+``data/sessions/<session_id>.jsonl``.  Listing or searching sessions by
+globbing that directory gets slow once thousands of transcripts accumulate,
+so each new session appends one line to ``data/sessions/index.jsonl``::
+
+    {"session_id": "...", "jsonl_path": "...", "date": "YYYY-MM-DD", "context": "coach"}
+
+Readers scan the manifest once instead of listing the directory.
+"""
+
+import json
+import mmap
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+SESSIONS_DIR = DATA_DIR / "sessions"
+INDEX_FILENAME = "index.jsonl"
+MMAP_MIN_BYTES = 16 * 1024  # Transcripts smaller than this are read in one go
+
+
+def append_session_entry(
+    session_id: str,
+    jsonl_path: Path,
+    context: str = "coach",
+    sessions_dir: Path | None = None,
+) -> dict:
+    """Append a session record to the manifest. Returns the written entry.
+
+    The manifest is opened in append mode, so the cost is one short write
+    regardless of how many sessions already exist.
+    """
+    dest = Path(sessions_dir) if sessions_dir else SESSIONS_DIR
+    dest.mkdir(parents=True, exist_ok=True)
+
+    entry = {
+        "session_id": session_id,
+        "jsonl_path": str(jsonl_path),
+        "date": datetime.now().date().isoformat(),
+        "context": context,
+    }
+    with (dest / INDEX_FILENAME).open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return entry
+
+
+def list_sessions(sessions_dir: Path | None = None) -> list[dict]:
+    """Return manifest entries, most recent first.
+
+    Malformed lines (e.g. a partially written final line) are skipped.
+    """
+    src = Path(sessions_dir) if sessions_dir else SESSIONS_DIR
+    index_path = src / INDEX_FILENAME
+    if not index_path.exists():
+        return []
+
+    entries = list(iter_jsonl(index_path))
+    entries.reverse()
+    return entries
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
+    """Yield parsed records from a JSONL file, one line at a time.
+
+    Streams the file instead of splitting its full text into a list, and
+    skips blank or malformed lines.
+    """
+    with Path(path).open(encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def search_sessions(
+    query: str,
+    limit: int = 10,
+    sessions_dir: Path | None = None,
+) -> list[dict]:
+    """Case-insensitive search over local session transcripts.
+
+    Candidate files come from the manifest, newest first. Each match is
+    returned in the same shape as the Supabase-backed session search:
+    ``session_id``, ``date``, ``summary`` (first matching message) and ``tags``.
+    """
+    needle = query.lower()
+    results = []
+
+    for entry in list_sessions(sessions_dir):
+        path = Path(entry.get("jsonl_path", ""))
+        if not path.exists():
+            continue
+
+        match = _first_matching_message(path, needle)
+        if match is None:
+            continue
+
+        results.append({
+            "session_id": entry.get("session_id", ""),
+            "date": entry.get("date", ""),
+            "summary": match[:500],
+            "tags": [],
+        })
+        if len(results) >= limit:
+            break
+
+    return results
+
+
+def _first_matching_message(path: Path, needle: str) -> str | None:
+    """Return the content of the first user/model message containing needle.
+
+    Large transcripts are memory-mapped and scanned line by line; a raw-bytes
+    containment test skips lines that cannot match before any JSON parsing.
+    """
+    if path.stat().st_size < MMAP_MIN_BYTES:
+        lines = path.read_bytes().splitlines()
+        return _scan_lines(lines, needle)
+
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _scan_lines(iter(mm.readline, b""), needle)
+
+
+def _scan_lines(lines, needle: str) -> str | None:
+    """Scan raw JSONL lines for the first user/model message containing needle."""
+    raw_needle = _raw_prefilter(needle)
+    for line in lines:
+        if raw_needle is not None and raw_needle not in line.lower():
+            continue
+        if not line.strip():
+            continue
+        try:
+            entry = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if entry.get("role") not in ("user", "model"):
+            continue
+        content = entry.get("content") or ""
+        if needle in content.lower():
+            return content
+    return None
+
+
+def _raw_prefilter(needle: str) -> bytes | None:
+    """Return needle as bytes if a raw-line test is safe, else None.
+
+    ``bytes.lower()`` only folds ASCII, and JSON escapes quotes, backslashes
+    and control characters, so only plain printable-ASCII needles qualify.
+    """
+    if not needle or not needle.isascii() or not needle.isprintable():
+        return None
+    if '"' in needle or "\\" in needle:
+        return None
+    return needle.encode("ascii")
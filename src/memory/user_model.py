@@ -6,7 +6,9 @@ durability, and embedding vectors for similarity search.
 """
 
 import json
+import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -20,6 +22,7 @@ MODEL_PATH = MODEL_DIR / "model.json"
 ARCHIVE_PATH = MODEL_DIR / "beliefs_archive.json"
 
 EMBEDDING_MODEL = "models/text-embedding-004"
+EMBEDDING_MAX_WORKERS = 8  # Concurrent embed_content calls in embed_beliefs()
 
 # Valid category values for beliefs
 BELIEF_CATEGORIES = {
@@ -46,7 +49,13 @@ def _today_iso() -> str:
 class UserModel:
     """Belief-driven user model with embedding-based similarity search."""
 
-    def __init__(self, data_dir: Path | None = None):
+    def __init__(self, data_dir: Path | None = None, initial_core: dict | None = None):
+        """Create an empty model.
+
+        initial_core, if given, is merged into the default structured_core
+        in one step (nested dicts such as ``goal`` are merged key by key),
+        instead of one update_structured_core() call per field.
+        """
         self._data_dir = Path(data_dir) if data_dir else MODEL_DIR
         self._model_path = self._data_dir / "model.json"
         self._archive_path = self._data_dir / "beliefs_archive.json"
@@ -79,6 +88,22 @@ class UserModel:
             "sessions_completed": 0,
             "last_interaction": None,
         }
+        # Bumped on every structured_core write; lets prompt builders reuse
+        # the rendered profile until it actually changes.
+        self.core_version = 0
+        # Bumped by every belief mutation method; together with core_version
+        # it keys the memoized get_model_summary() text.
+        self.beliefs_version = 0
+        self._summary_cache: tuple[tuple, str] | None = None
+
+        if initial_core:
+            for key, value in initial_core.items():
+                current = self.structured_core.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    current.update(value)
+                else:
+                    self.structured_core[key] = value
+            self.core_version += 1
 
     # ── Belief CRUD ──────────────────────────────────────────────
 
@@ -100,11 +125,12 @@ class UserModel:
         belief = {
             "id": f"belief_{uuid.uuid4().hex[:8]}",
             "text": text,
-            "category": category if category in BELIEF_CATEGORIES else "preference",
+            # Interned so category filters compare by identity first.
+            "category": sys.intern(category) if category in BELIEF_CATEGORIES else "preference",
             "confidence": max(0.0, min(1.0, confidence)),
             "stability": stability,
             "durability": durability,
-            "source": source,
+            "source": sys.intern(source) if source else source,
             "source_ref": source_ref,
             "first_observed": now,
             "last_confirmed": now,
@@ -122,9 +148,17 @@ class UserModel:
             "outcome_history": [],
         }
         self.beliefs.append(belief)
+        self.beliefs_version += 1
         self.meta["updated_at"] = now
         return belief
 
+    def add_beliefs(self, beliefs: list[dict]) -> list[dict]:
+        """Create several beliefs; each dict holds add_belief() keyword arguments.
+
+        Example: add_beliefs([{"text": "Runs early", "category": "scheduling"}])
+        """
+        return [self.add_belief(**spec) for spec in beliefs]
+
     def update_belief(
         self,
         belief_id: str,
@@ -141,6 +175,7 @@ class UserModel:
                 if new_confidence is not None:
                     belief["confidence"] = max(0.0, min(1.0, new_confidence))
                 belief["last_confirmed"] = now
+                self.beliefs_version += 1
                 self.meta["updated_at"] = now
                 return belief
         return None
@@ -159,6 +194,7 @@ class UserModel:
                 belief["valid_until"] = _today_iso()
                 if superseded_by:
                     belief["superseded_by"] = superseded_by
+                self.beliefs_version += 1
                 self.meta["updated_at"] = now
                 return belief
         return None
@@ -169,16 +205,12 @@ class UserModel:
         min_confidence: float = 0.0,
     ) -> list[dict]:
         """Retrieve active beliefs, optionally filtered by category and confidence."""
-        results = []
-        for b in self.beliefs:
-            if not b["active"]:
-                continue
-            if category and b["category"] != category:
-                continue
-            if b["confidence"] < min_confidence:
-                continue
-            results.append(b)
-        return results
+        return [
+            b for b in self.beliefs
+            if b["active"]
+            and (not category or b["category"] == category)
+            and b["confidence"] >= min_confidence
+        ]
 
     # ── Outcome Recording (P6: active memory) ───────────────────
 
@@ -225,6 +257,7 @@ class UserModel:
                     "detail": detail,
                 })
 
+                self.beliefs_version += 1
                 self.meta["updated_at"] = now
                 return belief
         return None
@@ -252,7 +285,14 @@ class UserModel:
 
         This implements the PrefEval reminder injection pattern:
         active beliefs are formatted as COACH'S NOTES for every LLM call.
+
+        The rendered text is reused until structured_core or the beliefs
+        change through this class's methods.
         """
+        key = (self.core_version, self.beliefs_version, len(self.beliefs))
+        if self._summary_cache is not None and self._summary_cache[0] == key:
+            return self._summary_cache[1]
+
         lines = []
 
         # Structured core summary
@@ -295,17 +335,17 @@ class UserModel:
             lines.append("\nCOACH'S NOTES ON THIS ATHLETE:")
             by_cat: dict[str, list[str]] = {}
             for b in active:
-                cat = b["category"]
-                if cat not in by_cat:
-                    by_cat[cat] = []
-                by_cat[cat].append(f"- {b['text']} (confidence: {b['confidence']:.1f})")
+                by_cat.setdefault(b["category"], []).append(
+                    f"  - {b['text']} (confidence: {b['confidence']:.1f})"
+                )
 
             for cat in sorted(by_cat):
                 lines.append(f"  [{cat.upper()}]")
-                for line in by_cat[cat]:
-                    lines.append(f"  {line}")
+                lines.extend(by_cat[cat])
 
-        return "\n".join(lines)
+        summary = "\n".join(lines)
+        self._summary_cache = (key, summary)
+        return summary
 
     # ── Profile Projection (backward compatibility) ──────────────
 
@@ -354,8 +394,17 @@ class UserModel:
                 target[part] = {}
             target = target[part]
         target[parts[-1]] = value
+        self.core_version += 1
         self.meta["updated_at"] = _now_iso()
 
+    def update_structured_core_bulk(self, updates: dict) -> None:
+        """Apply several dot-notation updates to structured_core at once.
+
+        Example: update_structured_core_bulk({"name": "Lena", "goal.event": "10K"})
+        """
+        for field_path, value in updates.items():
+            self.update_structured_core(field_path, value)
+
     # ── Embedding & Similarity Search ────────────────────────────
 
     def embed_belief(self, belief: dict) -> list[float] | None:
@@ -376,6 +425,23 @@ class UserModel:
         except Exception:
             return None
 
+    def embed_beliefs(self, beliefs: list[dict] | None = None) -> int:
+        """Embed several beliefs concurrently. Returns the number embedded.
+
+        Embedding calls are independent network round-trips, so they run on a
+        small thread pool instead of one after another. Defaults to all active
+        beliefs that have no embedding yet.
+        """
+        if beliefs is None:
+            beliefs = [b for b in self.get_active_beliefs() if not b.get("embedding")]
+        if not beliefs:
+            return 0
+
+        workers = min(EMBEDDING_MAX_WORKERS, len(beliefs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            vectors = list(pool.map(self.embed_belief, beliefs))
+        return sum(1 for v in vectors if v is not None)
+
     def find_similar_beliefs(
         self,
         candidate_text: str,
@@ -489,17 +555,20 @@ class UserModel:
 
     # ── Persistence ──────────────────────────────────────────────
 
+    def to_dict(self) -> dict:
+        """Return the persisted form of the model (shares, not copies, state)."""
+        return {
+            "structured_core": self.structured_core,
+            "beliefs": self.beliefs,
+            "meta": self.meta,
+        }
+
     def save(self) -> Path:
         """Save user model to disk. Returns the path."""
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self.meta["updated_at"] = _now_iso()
 
-        data = {
-            "structured_core": self.structured_core,
-            "beliefs": self.beliefs,
-            "meta": self.meta,
-        }
-        self._model_path.write_text(json.dumps(data, indent=2))
+        self._model_path.write_text(json.dumps(self.to_dict(), indent=2))
         return self._model_path
 
     def load(self) -> "UserModel":
@@ -512,11 +581,15 @@ class UserModel:
 
         data = json.loads(self._model_path.read_text())
         self.structured_core = data.get("structured_core", self.structured_core)
+        self.core_version += 1
         self.beliefs = data.get("beliefs", [])
+        self.beliefs_version += 1
         self.meta = data.get("meta", self.meta)
 
-        # Backfill outcome fields for beliefs created before P6
         for belief in self.beliefs:
+            if isinstance(belief.get("category"), str):
+                belief["category"] = sys.intern(belief["category"])
+            # Backfill outcome fields for beliefs created before P6
             belief.setdefault("utility", 0.0)
             belief.setdefault("outcome_count", 0)
             belief.setdefault("last_outcome", None)
@@ -528,8 +601,7 @@ class UserModel:
     def load_or_create(cls, data_dir: Path | None = None) -> "UserModel":
         """Load existing model or create a new one."""
         model = cls(data_dir=data_dir)
-        try:
+        # New users are the common case; check first rather than raise and catch
+        if model._model_path.exists():
             model.load()
-        except FileNotFoundError:
-            pass
         return model
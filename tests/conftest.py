@@ -1,3 +1,156 @@
 """Shared test fixtures for AgenticSports test suite."""
 
+import copy
+import itertools
+from datetime import datetime, timezone
+
 import pytest
+
+from src.agent import llm, system_prompt
+from src.config import get_settings
+from src.db.client import get_supabase
+from src.memory import episodes
+from src.memory.user_model import UserModel
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--integration", action="store_true", default=False,
+        help="Also run tests marked @pytest.mark.integration (real external APIs).",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip integration-marked tests unless --integration is given."""
+    if config.getoption("--integration"):
+        return
+    skip = pytest.mark.skip(reason="integration test -- pass --integration to run")
+    for item in items:
+        if item.get_closest_marker("integration") is not None:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _reset_process_caches():
+    """Clear process-wide caches when a test module finishes.
+
+    Settings, the Supabase and Gemini clients, rendered profiles and
+    meta-reflection results are cached for the life of the process.
+    Resetting them per module keeps results independent of module order (and
+    of how modules are split across parallel workers) without paying the
+    rebuild cost on every test. Per-test files live under tmp_path, so there
+    is no shared on-disk state to reset.
+    """
+    yield
+    get_settings.cache_clear()
+    get_supabase.cache_clear()
+    llm._client_for_key.cache_clear()
+    system_prompt._PROFILE_CACHE.clear()
+    episodes._META_CACHE.clear()
+
+
+class InMemoryUserModel(UserModel):
+    """UserModel whose save/load/archive keep snapshots in memory, not on disk."""
+
+    def __init__(self):
+        super().__init__(data_dir=None)
+        self._snapshot: dict | None = None
+        self.archive: list[dict] = []
+
+    def save(self):
+        self._snapshot = copy.deepcopy(self.to_dict())
+        return self._model_path
+
+    def load(self) -> "InMemoryUserModel":
+        if self._snapshot is None:
+            raise FileNotFoundError("InMemoryUserModel has not been saved")
+        data = copy.deepcopy(self._snapshot)
+        self.structured_core = data["structured_core"]
+        self.core_version += 1
+        self.beliefs = data["beliefs"]
+        self.beliefs_version += 1
+        self.meta = data["meta"]
+        return self
+
+    def _append_to_archive(self, beliefs: list[dict]) -> None:
+        self.archive.extend({k: v for k, v in b.items() if k != "embedding"} for b in beliefs)
+
+
+@pytest.fixture
+def memory_user_model() -> InMemoryUserModel:
+    """A real UserModel that never touches the filesystem.
+
+    Use it for tests about beliefs, summaries and structured_core logic;
+    tests that check what lands on disk should keep UserModel(data_dir=tmp_path).
+    """
+    return InMemoryUserModel()
+
+
+class InMemoryProactiveQueue:
+    """Dict-backed stand-in for src.db.proactive_queue_db.
+
+    Mirrors the DB semantics the proactive layer relies on: one pending row
+    per (user_id, trigger_type) is upserted, and pending rows are returned
+    by descending priority.
+    """
+
+    def __init__(self):
+        self.rows: list[dict] = []
+        self._ids = itertools.count(1)
+
+    def _find(self, user_id: str, message_id: str) -> dict | None:
+        return next(
+            (r for r in self.rows if r["id"] == message_id and r["user_id"] == user_id),
+            None,
+        )
+
+    def queue_message(self, user_id, trigger_type, priority, data, message_text) -> dict:
+        row = next(
+            (r for r in self.rows
+             if r["user_id"] == user_id and r["trigger_type"] == trigger_type
+             and r["status"] == "pending"),
+            None,
+        )
+        if row is None:
+            row = {"id": str(next(self._ids)), "user_id": user_id, "trigger_type": trigger_type}
+            self.rows.append(row)
+        row.update(priority=priority, data=data, message_text=message_text, status="pending")
+        return dict(row)
+
+    def get_pending_messages(self, user_id) -> list[dict]:
+        pending = [r for r in self.rows if r["user_id"] == user_id and r["status"] == "pending"]
+        return [dict(r) for r in sorted(pending, key=lambda r: r["priority"], reverse=True)]
+
+    def deliver_message(self, user_id, message_id) -> dict | None:
+        row = self._find(user_id, message_id)
+        if row is None:
+            return None
+        row.update(status="delivered", delivered_at=datetime.now(timezone.utc).isoformat())
+        return dict(row)
+
+    def record_engagement(
+        self, user_id, message_id, responded=False, continued_session=False, turns_after=0,
+    ) -> dict | None:
+        row = self._find(user_id, message_id)
+        if row is None:
+            return None
+        row["engagement_tracking"] = {
+            "user_responded_at": datetime.now(timezone.utc).isoformat() if responded else None,
+            "response_latency_seconds": None,
+            "user_continued_session": continued_session,
+            "session_turns_after_delivery": turns_after,
+        }
+        return dict(row)
+
+
+@pytest.fixture
+def memory_proactive_queue(monkeypatch) -> InMemoryProactiveQueue:
+    """Route src.db.proactive_queue_db through an in-memory queue.
+
+    For lifecycle tests of src.agent.proactive that care about queue
+    behaviour rather than the Supabase calls themselves.
+    """
+    queue = InMemoryProactiveQueue()
+    for name in ("queue_message", "get_pending_messages", "deliver_message", "record_engagement"):
+        monkeypatch.setattr(f"src.db.proactive_queue_db.{name}", getattr(queue, name))
+    return queue
@@ -0,0 +1,24 @@
+"""Plain helpers shared by test modules (import them; they are not fixtures)."""
+
+from datetime import datetime
+
+# Reference "now" for tests that pin a module's clock with freeze_datetime().
+FROZEN_NOW = datetime(2026, 2, 10, 10, 0, 0)
+
+
+def freeze_datetime(monkeypatch, module_path: str, now: datetime = FROZEN_NOW) -> datetime:
+    """Replace ``<module_path>.datetime`` with a subclass whose now() returns *now*.
+
+    ``now(tz)`` returns the same wall-clock time tagged with *tz*, so
+    timezone-aware callers never silently get a naive value.
+
+    Example: freeze_datetime(monkeypatch, "src.agent.proactive")
+    """
+
+    class _FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now if tz is None else now.replace(tzinfo=tz)
+
+    monkeypatch.setattr(f"{module_path}.datetime", _FrozenDatetime)
+    return now
@@ -13,6 +13,7 @@ so tests are fully isolated and fast.
 from __future__ import annotations
 
 import asyncio
+import inspect
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -32,6 +33,17 @@ def heartbeat() -> HeartbeatService:
     return HeartbeatService(interval_seconds=9999)  # interval so long _loop never fires twice
 
 
+@pytest.fixture(scope="module")
+def heartbeat_sources() -> dict:
+    """Source text of the heartbeat module and its trigger check, read once."""
+    import src.services.heartbeat as hb_module
+
+    return {
+        hb_module: inspect.getsource(hb_module),
+        hb_module._check_triggers_for_user: inspect.getsource(hb_module._check_triggers_for_user),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Start / Stop
 # ---------------------------------------------------------------------------
@@ -198,12 +210,11 @@ async def test_tick_processes_active_users():
 
 
 @pytest.mark.asyncio
-async def test_check_triggers_uses_merged_daily_metrics():
+async def test_check_triggers_uses_merged_daily_metrics(heartbeat_sources):
     """_check_triggers_for_user must use get_merged_daily_metrics, not list_daily_metrics."""
-    import inspect
     from src.services.heartbeat import _check_triggers_for_user
 
-    source = inspect.getsource(_check_triggers_for_user)
+    source = heartbeat_sources[_check_triggers_for_user]
 
     # Must import get_merged_daily_metrics
     assert "get_merged_daily_metrics" in source, (
@@ -215,12 +226,11 @@ async def test_check_triggers_uses_merged_daily_metrics():
     )
 
 
-def test_heartbeat_source_does_not_reference_list_daily_metrics():
+def test_heartbeat_source_does_not_reference_list_daily_metrics(heartbeat_sources):
     """The heartbeat module source must not contain list_daily_metrics anywhere."""
     import src.services.heartbeat as hb_module
-    import inspect
 
-    full_source = inspect.getsource(hb_module)
+    full_source = heartbeat_sources[hb_module]
     assert "list_daily_metrics" not in full_source, (
         "heartbeat.py should use get_merged_daily_metrics, not list_daily_metrics"
     )
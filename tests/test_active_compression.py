@@ -63,6 +63,28 @@ def _make_tool_call(name: str = "get_activities", args: dict | None = None):
     return tc
 
 
+@pytest.fixture
+def make_loop():
+    """Factory for file-mode AgentLoops with settings and tool registry patched.
+
+    ``make_loop(openai_tools)`` wires the registry mock and returns a fresh
+    loop, so tests only patch what they actually vary (LLM and tool calls).
+    """
+    with patch("src.agent.agent_loop.get_settings") as mock_settings, \
+            patch("src.agent.tools.registry.get_default_tools") as mock_tools:
+        mock_settings.return_value = MagicMock(
+            use_supabase=False, agenticsports_user_id="test",
+        )
+
+        def _make(openai_tools: list | None = None) -> AgentLoop:
+            registry = MagicMock()
+            registry.get_openai_tools.return_value = openai_tools or []
+            mock_tools.return_value = registry
+            return AgentLoop(user_model=_make_user_model())
+
+        yield _make
+
+
 # ---------------------------------------------------------------------------
 # System prompt hint
 # ---------------------------------------------------------------------------
@@ -95,14 +117,8 @@ class TestSystemPromptHint:
 
 
 class TestCounterInitialization:
-    @patch("src.agent.tools.registry.get_default_tools")
-    @patch("src.agent.agent_loop.get_settings")
-    def test_counter_initialized_to_zero(self, mock_settings, mock_tools) -> None:
-        mock_settings.return_value = MagicMock(
-            use_supabase=False, agenticsports_user_id="test",
-        )
-        mock_tools.return_value = MagicMock()
-        loop = AgentLoop(user_model=_make_user_model())
+    def test_counter_initialized_to_zero(self, make_loop) -> None:
+        loop = make_loop()
         assert loop._consecutive_tool_calls == 0
 
 
@@ -114,17 +130,10 @@ class TestCounterInitialization:
 class TestCounterResetsOnTextResponse:
     @patch("src.agent.agent_loop.execute_with_budget")
     @patch("src.agent.agent_loop.chat_completion")
-    @patch("src.agent.tools.registry.get_default_tools")
-    @patch("src.agent.agent_loop.get_settings")
     def test_counter_resets_on_text_response(
-        self, mock_settings, mock_tools, mock_chat, mock_exec,
+        self, mock_chat, mock_exec, make_loop,
     ) -> None:
-        mock_settings.return_value = MagicMock(
-            use_supabase=False, agenticsports_user_id="test",
-        )
-        registry = MagicMock()
-        registry.get_openai_tools.return_value = [{"type": "function", "function": {"name": "get_activities"}}]
-        mock_tools.return_value = registry
+        openai_tools = [{"type": "function", "function": {"name": "get_activities"}}]
 
         # First call: tool call (increments counter)
         # Second call: text response (resets counter)
@@ -134,7 +143,7 @@ class TestCounterResetsOnTextResponse:
         ]
         mock_exec.return_value = {"activities": []}
 
-        loop = AgentLoop(user_model=_make_user_model())
+        loop = make_loop(openai_tools)
         loop._consecutive_tool_calls = 5  # simulate prior tool calls
 
         result = loop.process_message("How was my training?")
@@ -151,17 +160,10 @@ class TestCounterResetsOnTextResponse:
 class TestCounterIncrementsOnToolCalls:
     @patch("src.agent.agent_loop.execute_with_budget")
     @patch("src.agent.agent_loop.chat_completion")
-    @patch("src.agent.tools.registry.get_default_tools")
-    @patch("src.agent.agent_loop.get_settings")
     def test_counter_increments_each_tool_round(
-        self, mock_settings, mock_tools, mock_chat, mock_exec,
+        self, mock_chat, mock_exec, make_loop,
     ) -> None:
-        mock_settings.return_value = MagicMock(
-            use_supabase=False, agenticsports_user_id="test",
-        )
-        registry = MagicMock()
-        registry.get_openai_tools.return_value = [{"type": "function", "function": {"name": "get_activities"}}]
-        mock_tools.return_value = registry
+        openai_tools = [{"type": "function", "function": {"name": "get_activities"}}]
 
         # 3 rounds of tool calls, then text response
         mock_chat.side_effect = [
@@ -172,7 +174,7 @@ class TestCounterIncrementsOnToolCalls:
         ]
         mock_exec.return_value = {"data": "ok"}
 
-        loop = AgentLoop(user_model=_make_user_model())
+        loop = make_loop(openai_tools)
         assert loop._consecutive_tool_calls == 0
 
         result = loop.process_message("Analyze my week")
@@ -190,17 +192,10 @@ class TestCounterIncrementsOnToolCalls:
 class TestSummaryInjectionAfter8Rounds:
     @patch("src.agent.agent_loop.execute_with_budget")
     @patch("src.agent.agent_loop.chat_completion")
-    @patch("src.agent.tools.registry.get_default_tools")
-    @patch("src.agent.agent_loop.get_settings")
     def test_summary_injected_after_8_tool_rounds(
-        self, mock_settings, mock_tools, mock_chat, mock_exec,
+        self, mock_chat, mock_exec, make_loop,
     ) -> None:
-        mock_settings.return_value = MagicMock(
-            use_supabase=False, agenticsports_user_id="test",
-        )
-        registry = MagicMock()
-        registry.get_openai_tools.return_value = [{"type": "function", "function": {"name": "t"}}]
-        mock_tools.return_value = registry
+        openai_tools = [{"type": "function", "function": {"name": "t"}}]
 
         # 8 rounds of tool calls, then after injection the model responds with text
         responses = [
@@ -211,7 +206,7 @@ class TestSummaryInjectionAfter8Rounds:
         mock_chat.side_effect = responses
         mock_exec.return_value = {"ok": True}
 
-        loop = AgentLoop(user_model=_make_user_model())
+        loop = make_loop(openai_tools)
         result = loop.process_message("Do everything")
 
         # Verify the injection message was appended to messages
@@ -226,18 +221,9 @@ class TestSummaryInjectionAfter8Rounds:
 
     @patch("src.agent.agent_loop.execute_with_budget")
     @patch("src.agent.agent_loop.chat_completion")
-    @patch("src.agent.tools.registry.get_default_tools")
-    @patch("src.agent.agent_loop.get_settings")
     def test_injection_message_has_correct_format(
-        self, mock_settings, mock_tools, mock_chat, mock_exec,
+        self, mock_chat, mock_exec, make_loop,
     ) -> None:
-        mock_settings.return_value = MagicMock(
-            use_supabase=False, agenticsports_user_id="test",
-        )
-        registry = MagicMock()
-        registry.get_openai_tools.return_value = []
-        mock_tools.return_value = registry
-
         responses = [
             _make_llm_response(tool_calls=[_make_tool_call(f"t{i}")])
             for i in range(TOOL_CALL_SUMMARY_THRESHOLD)
@@ -246,7 +232,7 @@ class TestSummaryInjectionAfter8Rounds:
         mock_chat.side_effect = responses
         mock_exec.return_value = {"ok": True}
 
-        loop = AgentLoop(user_model=_make_user_model())
+        loop = make_loop()
         loop.process_message("Go")
 
         injection = next(
@@ -265,18 +251,9 @@ class TestSummaryInjectionAfter8Rounds:
 class TestCounterResetsAfterInjection:
     @patch("src.agent.agent_loop.execute_with_budget")
     @patch("src.agent.agent_loop.chat_completion")
-    @patch("src.agent.tools.registry.get_default_tools")
-    @patch("src.agent.agent_loop.get_settings")
     def test_counter_resets_after_injection(
-        self, mock_settings, mock_tools, mock_chat, mock_exec,
+        self, mock_chat, mock_exec, make_loop,
     ) -> None:
-        mock_settings.return_value = MagicMock(
-            use_supabase=False, agenticsports_user_id="test",
-        )
-        registry = MagicMock()
-        registry.get_openai_tools.return_value = []
-        mock_tools.return_value = registry
-
         # 8 tool rounds -> injection (counter reset) -> 2 more tool rounds -> text
         responses = [
             _make_llm_response(tool_calls=[_make_tool_call(f"t{i}")])
@@ -289,7 +266,7 @@ class TestCounterResetsAfterInjection:
         mock_chat.side_effect = responses
         mock_exec.return_value = {"ok": True}
 
-        loop = AgentLoop(user_model=_make_user_model())
+        loop = make_loop()
         result = loop.process_message("Complex task")
 
         # Counter should be 0 because text response resets it
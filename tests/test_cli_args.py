@@ -0,0 +1,54 @@
+"""Tests for CLI argument parsing and dispatch (src.interface.cli)."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from src.interface.cli import build_parser, main
+
+
+@pytest.fixture(scope="module")
+def parser():
+    """One parser for the whole module -- parse_args() does not mutate it."""
+    return build_parser()
+
+
+class TestCLIArgParsing:
+    def test_no_flags_defaults_to_chat_mode(self, parser) -> None:
+        parsed = parser.parse_args([])
+        assert not any([parsed.assess, parsed.trajectory, parsed.status, parsed.onboard_legacy])
+        assert parsed.import_file is None
+
+    @pytest.mark.parametrize("flag,attr", [
+        ("--chat", "chat"),
+        ("--assess", "assess"),
+        ("--trajectory", "trajectory"),
+        ("--status", "status"),
+        ("--onboard-legacy", "onboard_legacy"),
+    ])
+    def test_boolean_flags(self, parser, flag: str, attr: str) -> None:
+        assert getattr(parser.parse_args([flag]), attr) is True
+
+    def test_import_sets_import_file(self, parser) -> None:
+        assert parser.parse_args(["--import", "run.fit"]).import_file == "run.fit"
+
+    def test_unknown_flag_exits(self, parser) -> None:
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--nope"])
+
+
+class TestCLIDispatch:
+    @pytest.mark.parametrize("target,args,expected_args", [
+        ("import_activity", ["--import", "t.fit"], ("t.fit",)),
+        ("run_assessment", ["--assess"], ()),
+        ("run_trajectory", ["--trajectory"], ()),
+        ("run_status", ["--status"], ()),
+        ("run_chat", [], ()),
+        ("run_chat", ["--chat"], ()),
+    ])
+    def test_cli_dispatch(self, target: str, args: list[str], expected_args: tuple) -> None:
+        with patch(f"src.interface.cli.{target}") as handler:
+            main(args)
+        handler.assert_called_once_with(*expected_args)
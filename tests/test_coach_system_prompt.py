@@ -0,0 +1,41 @@
+"""Tests for build_coach_system_prompt session-schema handling.
+
+Covers:
+- Generic fallback when no schemas exist or the DB lookup fails
+- DB-stored schemas rendered into the prompt
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from src.agent.prompts import _GENERIC_SESSION_SCHEMA_SECTION, build_coach_system_prompt
+
+
+class TestBuildCoachSystemPrompt:
+    @patch("src.db.agent_config_db.get_session_schemas", return_value=[])
+    def test_no_schemas_uses_generic_section(self, mock_schemas) -> None:
+        prompt = build_coach_system_prompt("user-1")
+        assert _GENERIC_SESSION_SCHEMA_SECTION in prompt
+        mock_schemas.assert_called_once_with("user-1")
+
+    @patch("src.db.agent_config_db.get_session_schemas", side_effect=Exception("DB down"))
+    def test_db_failure_uses_generic_section(self, mock_schemas) -> None:
+        prompt = build_coach_system_prompt("user-1")
+        assert _GENERIC_SESSION_SCHEMA_SECTION in prompt
+
+    @patch("src.db.agent_config_db.get_session_schemas")
+    def test_schemas_rendered_into_prompt(self, mock_schemas) -> None:
+        mock_schemas.return_value = [
+            {
+                "sport": "running",
+                "schema": {
+                    "step_types": ["warmup", "interval"],
+                    "target_keys": {"pace_min_km": "4:30-4:45"},
+                },
+            },
+        ]
+        prompt = build_coach_system_prompt("user-1")
+        assert _GENERIC_SESSION_SCHEMA_SECTION not in prompt
+        assert "Step types: warmup, interval" in prompt
+        assert '- Running: {"pace_min_km": "4:30-4:45"}' in prompt
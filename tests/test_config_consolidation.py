@@ -12,6 +12,8 @@ Covers:
 from __future__ import annotations
 
 import json
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -33,13 +35,9 @@ from src.services.config_gc import (
 USER_ID = "test-user-consolidation"
 
 
-def _mock_llm_response(content: str) -> MagicMock:
+def _mock_llm_response(content: str) -> SimpleNamespace:
     """Build a mock LiteLLM response with the given content."""
-    response = MagicMock()
-    choice = MagicMock()
-    choice.message.content = content
-    response.choices = [choice]
-    return response
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
 
 def _make_mock_supabase_for_consolidation(
@@ -365,57 +363,50 @@ class TestConsolidateConfigs:
 
 
 class TestRunConfigGcConsolidation:
-    @patch("src.services.config_gc._consolidate_configs")
-    @patch("src.services.config_gc._check_duplicates", return_value=[])
-    @patch("src.services.config_gc._count_active_configs", return_value=75)
-    @patch("src.services.config_gc._archive_stale_configs", return_value=0)
-    def test_consolidation_triggered_above_cap(
-        self, mock_archive, mock_count, mock_dupes, mock_consolidate,
-    ) -> None:
+    @pytest.fixture
+    def gc_mocks(self):
+        """Patch run_config_gc's helpers in one go; 75 active configs by default."""
+        with ExitStack() as stack:
+            def _patch(name: str, **kwargs):
+                return stack.enter_context(patch(f"src.services.config_gc.{name}", **kwargs))
+
+            yield SimpleNamespace(
+                archive=_patch("_archive_stale_configs", return_value=0),
+                count=_patch("_count_active_configs", return_value=75),
+                dupes=_patch("_check_duplicates", return_value=[]),
+                consolidate=_patch("_consolidate_configs"),
+            )
+
+    def test_consolidation_triggered_above_cap(self, gc_mocks) -> None:
         """When active_count > 60, consolidation is triggered."""
-        mock_consolidate.return_value = 3
+        gc_mocks.consolidate.return_value = 3
         result = run_config_gc(USER_ID)
 
-        mock_consolidate.assert_called_once_with(USER_ID)
+        gc_mocks.consolidate.assert_called_once_with(USER_ID)
         assert result["consolidated"] == 3
         assert "warning" in result
         assert "Consolidated 3" in result["warning"]
 
-    @patch("src.services.config_gc._consolidate_configs")
-    @patch("src.services.config_gc._check_duplicates", return_value=[])
-    @patch("src.services.config_gc._count_active_configs", return_value=50)
-    @patch("src.services.config_gc._archive_stale_configs", return_value=0)
-    def test_consolidation_not_triggered_below_cap(
-        self, mock_archive, mock_count, mock_dupes, mock_consolidate,
-    ) -> None:
+    def test_consolidation_not_triggered_below_cap(self, gc_mocks) -> None:
         """When active_count <= 60, consolidation is NOT triggered."""
+        gc_mocks.count.return_value = 50
         result = run_config_gc(USER_ID)
 
-        mock_consolidate.assert_not_called()
+        gc_mocks.consolidate.assert_not_called()
         assert "consolidated" not in result
         assert "warning" not in result
 
-    @patch("src.services.config_gc._consolidate_configs", side_effect=Exception("LLM down"))
-    @patch("src.services.config_gc._check_duplicates", return_value=[])
-    @patch("src.services.config_gc._count_active_configs", return_value=75)
-    @patch("src.services.config_gc._archive_stale_configs", return_value=0)
-    def test_consolidation_failure_doesnt_break_gc(
-        self, mock_archive, mock_count, mock_dupes, mock_consolidate,
-    ) -> None:
+    def test_consolidation_failure_doesnt_break_gc(self, gc_mocks) -> None:
         """Even if consolidation throws, GC returns a safe fallback result."""
+        gc_mocks.consolidate.side_effect = Exception("LLM down")
         result = run_config_gc(USER_ID)
         # The outer try/except catches the exception
         assert result["archived"] == 0
         assert result["active_count"] == 0
 
-    @patch("src.services.config_gc._consolidate_configs", return_value=0)
-    @patch("src.services.config_gc._check_duplicates", return_value=[])
-    @patch("src.services.config_gc._count_active_configs", return_value=75)
-    @patch("src.services.config_gc._archive_stale_configs", return_value=0)
-    def test_consolidation_zero_still_reports_warning(
-        self, mock_archive, mock_count, mock_dupes, mock_consolidate,
-    ) -> None:
+    def test_consolidation_zero_still_reports_warning(self, gc_mocks) -> None:
         """Even if consolidation finds nothing, the warning is still reported."""
+        gc_mocks.consolidate.return_value = 0
         result = run_config_gc(USER_ID)
         assert result["consolidated"] == 0
         assert "warning" in result
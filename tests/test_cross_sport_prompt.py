@@ -12,6 +12,8 @@ from unittest.mock import MagicMock, patch
 
 from src.agent.system_prompt import STATIC_SYSTEM_PROMPT, build_runtime_context
 
+_STATIC_PROMPT_LOWER = STATIC_SYSTEM_PROMPT.lower()
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -79,11 +81,11 @@ class TestStaticPromptMultiSportAwareness:
 
     def test_multi_sport_mentions_fatigue(self) -> None:
         """Multi-sport section references cumulative fatigue."""
-        assert "fatigue" in STATIC_SYSTEM_PROMPT.lower()
+        assert "fatigue" in _STATIC_PROMPT_LOWER
 
     def test_multi_sport_mentions_recovery(self) -> None:
         """Multi-sport section references recovery."""
-        assert "recovery" in STATIC_SYSTEM_PROMPT.lower()
+        assert "recovery" in _STATIC_PROMPT_LOWER
 
     def test_no_hardcoded_sport_rules(self) -> None:
         """Static prompt does NOT contain hardcoded sport-specific rules."""
@@ -11,6 +11,7 @@ Covers:
 from __future__ import annotations
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -53,7 +54,7 @@ DB_CRITERIA = [
 ]
 
 
-def _mock_llm_response(scores: dict, overall: int = 75) -> MagicMock:
+def _mock_llm_response(scores: dict, overall: int = 75) -> SimpleNamespace:
     """Create a mock LLM response with evaluation JSON."""
     result = {
         "overall_score": overall,
@@ -61,10 +62,9 @@ def _mock_llm_response(scores: dict, overall: int = 75) -> MagicMock:
         "issues": ["Test issue 1"],
         "suggestions": ["Test suggestion 1"],
     }
-    response = MagicMock()
-    response.choices = [MagicMock()]
-    response.choices[0].message.content = json.dumps(result)
-    return response
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(result)))],
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -14,6 +14,7 @@ Covers:
 from __future__ import annotations
 
 import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -49,11 +50,8 @@ def _make_weekly_episodes(n: int = 4, month: str = "2026-02") -> list[dict]:
     ]
 
 
-def _mock_llm_response(content: str) -> MagicMock:
-    response = MagicMock()
-    response.choices = [MagicMock()]
-    response.choices[0].message.content = content
-    return response
+def _mock_llm_response(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
 
 # ---------------------------------------------------------------------------
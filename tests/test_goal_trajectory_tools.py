@@ -10,6 +10,7 @@ All LLM, DB, and service dependencies are mocked.
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -59,12 +60,9 @@ _LLM_RESPONSE_BEHIND = {
 }
 
 
-def _mock_llm_response(content: str) -> MagicMock:
+def _mock_llm_response(content: str) -> SimpleNamespace:
     """Build a mock LLM response with the given content."""
-    response = MagicMock()
-    response.choices = [MagicMock()]
-    response.choices[0].message.content = content
-    return response
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
 
 def _mock_settings(user_id: str = USER_ID) -> MagicMock:
@@ -151,37 +151,30 @@ def _register_and_execute(
 # ---------------------------------------------------------------------------
 
 
-class TestHealthToolsRegistration:
-    """Verify both health tools are registered with the expected names."""
-
-    def test_get_health_data_registered(self) -> None:
-        registry = ToolRegistry()
-        with patch("src.agent.tools.health_tools.get_settings", return_value=_make_settings()):
-            from src.agent.tools.health_tools import register_health_tools
+@pytest.fixture(scope="module")
+def health_registry() -> ToolRegistry:
+    """A registry with health tools registered once; tests only inspect it."""
+    registry = ToolRegistry()
+    with patch("src.agent.tools.health_tools.get_settings", return_value=_make_settings()):
+        from src.agent.tools.health_tools import register_health_tools
 
-            register_health_tools(registry)
+        register_health_tools(registry)
+    return registry
 
-        names = [t["function"]["name"] for t in registry.get_openai_tools()]
-        assert "get_health_data" in names
 
-    def test_get_daily_metrics_registered(self) -> None:
-        registry = ToolRegistry()
-        with patch("src.agent.tools.health_tools.get_settings", return_value=_make_settings()):
-            from src.agent.tools.health_tools import register_health_tools
+class TestHealthToolsRegistration:
+    """Verify both health tools are registered with the expected names."""
 
-            register_health_tools(registry)
+    def test_get_health_data_registered(self, health_registry) -> None:
+        names = [t["function"]["name"] for t in health_registry.get_openai_tools()]
+        assert "get_health_data" in names
 
-        names = [t["function"]["name"] for t in registry.get_openai_tools()]
+    def test_get_daily_metrics_registered(self, health_registry) -> None:
+        names = [t["function"]["name"] for t in health_registry.get_openai_tools()]
         assert "get_daily_metrics" in names
 
-    def test_both_tools_in_data_category(self) -> None:
-        registry = ToolRegistry()
-        with patch("src.agent.tools.health_tools.get_settings", return_value=_make_settings()):
-            from src.agent.tools.health_tools import register_health_tools
-
-            register_health_tools(registry)
-
-        listed = registry.list_tools()
+    def test_both_tools_in_data_category(self, health_registry) -> None:
+        listed = health_registry.list_tools()
         health_tools = [t for t in listed if t["name"] in ("get_health_data", "get_daily_metrics")]
         assert all(t["category"] == "data" for t in health_tools)
 
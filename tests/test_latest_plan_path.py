@@ -0,0 +1,26 @@
+"""Tests for latest_plan_path() -- newest plan lookup in data/plans."""
+
+from __future__ import annotations
+
+from src.agent.coach import latest_plan_path
+
+
+class TestLatestPlanPath:
+    def test_returns_newest_plan(self, tmp_path) -> None:
+        for stamp in ("2026-01-05_080000", "2026-02-10_093000", "2026-01-20_120000"):
+            (tmp_path / f"plan_{stamp}.json").write_text("{}")
+
+        assert latest_plan_path(tmp_path) == tmp_path / "plan_2026-02-10_093000.json"
+
+    def test_ignores_non_plan_files(self, tmp_path) -> None:
+        (tmp_path / "plan_2026-01-05_080000.json").write_text("{}")
+        (tmp_path / "plan_2026-03-01_000000.json.bak").write_text("{}")
+        (tmp_path / "zz_notes.json").write_text("{}")
+
+        assert latest_plan_path(tmp_path).name == "plan_2026-01-05_080000.json"
+
+    def test_empty_dir_returns_none(self, tmp_path) -> None:
+        assert latest_plan_path(tmp_path) is None
+
+    def test_missing_dir_returns_none(self, tmp_path) -> None:
+        assert latest_plan_path(tmp_path / "missing") is None
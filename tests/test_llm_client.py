@@ -0,0 +1,37 @@
+"""Tests for the shared Gemini client in src.agent.llm.
+
+Covers:
+- Missing GEMINI_API_KEY raises
+- Repeated calls reuse one client
+- Changing the key builds a new client
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.agent.llm import _client_for_key, get_client
+
+
+@pytest.fixture(autouse=True)
+def _fresh_client_cache():
+    _client_for_key.cache_clear()
+    yield
+    _client_for_key.cache_clear()
+
+
+class TestGetClient:
+    def test_missing_key_raises(self, monkeypatch) -> None:
+        monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="GEMINI_API_KEY"):
+            get_client()
+
+    def test_client_reused_across_calls(self, monkeypatch) -> None:
+        monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+        assert get_client() is get_client()
+
+    def test_new_key_builds_new_client(self, monkeypatch) -> None:
+        monkeypatch.setenv("GEMINI_API_KEY", "key-a")
+        first = get_client()
+        monkeypatch.setenv("GEMINI_API_KEY", "key-b")
+        assert get_client() is not first
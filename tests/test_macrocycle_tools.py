@@ -13,6 +13,7 @@ All DB, LLM, and external dependencies are mocked.
 from __future__ import annotations
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -80,11 +81,8 @@ def _build_macrocycle_registry(
     return registry
 
 
-def _mock_llm_response(content: str) -> MagicMock:
-    resp = MagicMock()
-    resp.choices = [MagicMock()]
-    resp.choices[0].message.content = content
-    return resp
+def _mock_llm_response(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
 
 
 # ---------------------------------------------------------------------------
@@ -11,6 +11,8 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.agent.tools.registry import ToolRegistry
 
 
@@ -129,39 +131,28 @@ def _register_and_call(user_model: MagicMock, supabase_mock: MagicMock) -> dict:
 class TestOnboardingConfigGate:
     """Test the config gate in complete_onboarding."""
 
-    def test_fails_without_session_schemas(self) -> None:
-        user_model = _make_user_model()
-        sb = _build_supabase_mock(has_schemas=False)
-        result = _register_and_call(user_model, sb)
-
-        assert result["status"] == "error"
-        assert "session_schemas" in result["error"]
-
-    def test_fails_without_metrics(self) -> None:
-        user_model = _make_user_model()
-        sb = _build_supabase_mock(has_metrics=False)
-        result = _register_and_call(user_model, sb)
-
-        assert result["status"] == "error"
-        assert "metrics" in result["error"]
-
-    def test_fails_without_training_plan(self) -> None:
-        user_model = _make_user_model()
-        sb = _build_supabase_mock(has_plans=False)
-        result = _register_and_call(user_model, sb)
-
-        assert result["status"] == "error"
-        assert "training_plan" in result["error"]
-
-    def test_fails_with_multiple_missing(self) -> None:
+    @pytest.mark.parametrize("missing", [
+        pytest.param({"has_schemas": False}, id="session_schemas"),
+        pytest.param({"has_metrics": False}, id="metrics"),
+        pytest.param({"has_plans": False}, id="training_plan"),
+        pytest.param(
+            {"has_schemas": False, "has_metrics": False, "has_plans": False},
+            id="multiple",
+        ),
+    ])
+    def test_fails_when_config_missing(self, missing: dict[str, bool]) -> None:
         user_model = _make_user_model()
-        sb = _build_supabase_mock(has_schemas=False, has_metrics=False, has_plans=False)
+        sb = _build_supabase_mock(**missing)
         result = _register_and_call(user_model, sb)
 
         assert result["status"] == "error"
-        assert "session_schemas" in result["error"]
-        assert "metrics" in result["error"]
-        assert "training_plan" in result["error"]
+        expected = {
+            "has_schemas": "session_schemas",
+            "has_metrics": "metrics",
+            "has_plans": "training_plan",
+        }
+        for flag in missing:
+            assert expected[flag] in result["error"]
 
     def test_succeeds_when_all_present(self) -> None:
         user_model = _make_user_model()
@@ -7,10 +7,13 @@ Verifies that:
 - Runtime context is a separate string from the system prompt
 """
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from src.agent.system_prompt import (
     ONBOARDING_MODE_INSTRUCTIONS,
+    RUNTIME_CONTEXT_TOKEN_BUDGETS,
     STATIC_SYSTEM_PROMPT,
     build_runtime_context,
     build_system_prompt,
@@ -147,3 +150,72 @@ class TestSystemPromptCaching:
         # Runtime context SHOULD contain runtime data
         assert "TestAthlete99" in runtime
         assert "2026-03-05" in runtime
+
+
+class TestRuntimeContextTokenBudget:
+    """Test that optional runtime sections are packed within the token budget."""
+
+    @pytest.mark.parametrize("context", ["coach", "onboarding"])
+    def test_prompt_respects_token_budget(self, context: str) -> None:
+        """Oversized optional sections are dropped; required ones stay."""
+        user_model = _make_mock_user_model(name="Budget", sports=["running"])
+        user_model.get_active_beliefs.return_value = [
+            {"text": f"Belief number {i} " + "x" * 80, "category": "preference", "confidence": 0.8}
+            for i in range(2000)
+        ]
+
+        result = build_runtime_context(
+            user_model,
+            startup_context="Recent: 3 runs this week",
+            context=context,
+        )
+
+        assert len(result) // 4 <= RUNTIME_CONTEXT_TOKEN_BUDGETS[context]
+        assert "# Current Athlete" in result
+        assert "Recent: 3 runs this week" in result
+        assert "# Active Beliefs" not in result
+        assert ("ONBOARDING MODE" in result) == (context == "onboarding")
+
+    def test_small_sections_all_kept_in_order(self) -> None:
+        """Under budget, every section is emitted in its natural order."""
+        user_model = _make_mock_user_model(name="Budget", sports=["running"])
+        user_model.get_active_beliefs.return_value = [
+            {"text": "Prefers mornings", "category": "scheduling", "confidence": 0.8},
+        ]
+        user_model.get_active_plan_summary.return_value = "Week 3 of base"
+
+        result = build_runtime_context(user_model, startup_context="Recent: 1 run")
+
+        positions = [
+            result.index(marker)
+            for marker in ("# Current Date", "# Current Athlete", "# Active Beliefs",
+                           "# Active Training Plan", "# Pre-Loaded Session Context")
+        ]
+        assert positions == sorted(positions)
+
+
+class TestProfileRenderCache:
+    """Test that the rendered profile is reused until structured_core changes."""
+
+    def test_profile_cache_invalidated_on_update(self, memory_user_model) -> None:
+        model = memory_user_model
+        model.update_structured_core("name", "Lena")
+
+        with patch.object(model, "project_profile", wraps=model.project_profile) as spy:
+            first = build_runtime_context(model)
+            second = build_runtime_context(model)
+            assert spy.call_count == 1
+            assert first == second
+
+            model.update_structured_core("goal.event", "Berlin Marathon")
+            third = build_runtime_context(model)
+            assert spy.call_count == 2
+
+        assert "Goal: Berlin Marathon" in third
+        assert "Goal: Berlin Marathon" not in first
+
+    def test_mock_models_are_not_cached(self) -> None:
+        user_model = _make_mock_user_model(name="Mock")
+        build_runtime_context(user_model)
+        build_runtime_context(user_model)
+        assert user_model.project_profile.call_count == 2
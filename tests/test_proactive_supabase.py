@@ -15,7 +15,7 @@ Covers:
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import timedelta, timezone
 from unittest.mock import MagicMock, call, patch
 
 import pytest
@@ -32,6 +32,7 @@ from src.agent.proactive import (
     record_engagement,
     refresh_proactive_triggers,
 )
+from tests.helpers import FROZEN_NOW, freeze_datetime
 
 USER_ID = "test-user-id"
 
@@ -623,37 +624,46 @@ class TestFormatProactiveMessage:
 # ---------------------------------------------------------------------------
 
 
-class TestCalculateSilenceDecay:
-    def _ts(self, days_ago: float) -> str:
-        return (datetime.now() - timedelta(days=days_ago)).isoformat()
+_NOW_REF = FROZEN_NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin proactive's clock to _NOW_REF so silence lengths are exact."""
+    freeze_datetime(monkeypatch, "src.agent.proactive")
 
-    def test_no_last_interaction_returns_moderate_boost(self) -> None:
-        result = calculate_silence_decay(None)
-        assert result == 0.5
 
-    def test_active_within_one_day_returns_zero(self) -> None:
-        result = calculate_silence_decay(self._ts(0.5))
-        assert result == 0.0
+def _days_ago(days: float) -> str:
+    """ISO timestamp *days* before _NOW_REF."""
+    return (_NOW_REF - timedelta(days=days)).isoformat()
 
-    def test_one_to_three_days_returns_small_boost(self) -> None:
-        result = calculate_silence_decay(self._ts(2.0))
-        assert result == 0.1
 
-    def test_three_to_five_days_returns_medium_boost(self) -> None:
-        result = calculate_silence_decay(self._ts(4.0))
-        assert result == 0.3
+def test_frozen_clock_tags_requested_timezone(frozen_now) -> None:
+    from src.agent import proactive
 
-    def test_five_to_ten_days_returns_large_boost(self) -> None:
-        result = calculate_silence_decay(self._ts(7.0))
+    assert proactive.datetime.now() == _NOW_REF
+    assert proactive.datetime.now(timezone.utc) == _NOW_REF.replace(tzinfo=timezone.utc)
+
+
+@pytest.mark.usefixtures("frozen_now")
+class TestCalculateSilenceDecay:
+    def test_no_last_interaction_returns_moderate_boost(self) -> None:
+        result = calculate_silence_decay(None)
         assert result == 0.5
 
-    def test_more_than_ten_days_returns_maximum_boost(self) -> None:
-        result = calculate_silence_decay(self._ts(15.0))
-        assert result == 0.7
+    @pytest.mark.parametrize("days_ago,expected", [
+        (0.5, 0.0),   # active within a day
+        (2.0, 0.1),   # one to three days
+        (4.0, 0.3),   # three to five days
+        (7.0, 0.5),   # five to ten days
+        (15.0, 0.7),  # more than ten days
+    ])
+    def test_boost_per_silence_band(self, days_ago: float, expected: float) -> None:
+        assert calculate_silence_decay(_days_ago(days_ago)) == expected
 
     def test_urgency_is_monotonically_nondecreasing_with_silence(self) -> None:
         values = [
-            calculate_silence_decay(self._ts(d))
+            calculate_silence_decay(_days_ago(d))
             for d in [0.2, 1.5, 4.0, 7.0, 12.0]
         ]
         for i in range(len(values) - 1):
@@ -667,24 +677,22 @@ class TestCalculateSilenceDecay:
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("frozen_now")
 class TestCheckConversationTriggers:
-    def _ts(self, days_ago: float) -> str:
-        return (datetime.now() - timedelta(days=days_ago)).isoformat()
-
     def test_silence_below_five_days_produces_no_triggers(self) -> None:
-        triggers = check_conversation_triggers({}, last_interaction=self._ts(3.0))
+        triggers = check_conversation_triggers({}, last_interaction=_days_ago(3.0))
         types = [t["type"] for t in triggers]
         assert "silence_checkin" not in types
 
     def test_silence_five_plus_days_produces_checkin_trigger(self) -> None:
-        triggers = check_conversation_triggers({}, last_interaction=self._ts(6.0))
+        triggers = check_conversation_triggers({}, last_interaction=_days_ago(6.0))
         types = [t["type"] for t in triggers]
         assert "silence_checkin" in types
 
     def test_checkin_trigger_contains_days_since_last_chat(self) -> None:
-        triggers = check_conversation_triggers({}, last_interaction=self._ts(8.0))
+        triggers = check_conversation_triggers({}, last_interaction=_days_ago(8.0))
         checkin = next(t for t in triggers if t["type"] == "silence_checkin")
-        assert checkin["data"]["days_since_last_chat"] >= 7.9
+        assert checkin["data"]["days_since_last_chat"] == 8.0
 
     def test_no_last_interaction_produces_no_triggers(self) -> None:
         # When last_interaction is None the function skips the silence check
@@ -692,7 +700,7 @@ class TestCheckConversationTriggers:
         assert triggers == []
 
     def test_checkin_urgency_field_is_present(self) -> None:
-        triggers = check_conversation_triggers({}, last_interaction=self._ts(10.0))
+        triggers = check_conversation_triggers({}, last_interaction=_days_ago(10.0))
         checkin = next(t for t in triggers if t["type"] == "silence_checkin")
         assert "urgency" in checkin
         assert isinstance(checkin["urgency"], float)
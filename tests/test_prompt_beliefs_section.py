@@ -0,0 +1,36 @@
+"""Tests for the COACH'S NOTES belief section used in plan prompts.
+
+Covers:
+- Empty / None beliefs produce no section
+- Categories are emitted alphabetically, each exactly once
+- Beliefs keep their input order within a category
+"""
+
+from __future__ import annotations
+
+from src.agent.prompts import _format_beliefs_section
+
+
+class TestFormatBeliefsSection:
+    def test_no_beliefs_returns_empty_string(self) -> None:
+        assert _format_beliefs_section(None) == ""
+        assert _format_beliefs_section([]) == ""
+
+    def test_categories_sorted_alphabetically(self) -> None:
+        section = _format_beliefs_section([
+            {"text": "Runs early", "category": "scheduling", "confidence": 0.8},
+            {"text": "Knee niggle", "category": "physical", "confidence": 0.9},
+            {"text": "Races for fun", "category": "motivation", "confidence": 0.7},
+            {"text": "Free on Sundays", "category": "scheduling", "confidence": 0.6},
+        ])
+        headers = [line.strip() for line in section.splitlines() if line.strip().startswith("[")]
+        assert headers == ["[MOTIVATION]", "[PHYSICAL]", "[SCHEDULING]"]
+
+    def test_input_order_kept_within_category(self) -> None:
+        section = _format_beliefs_section([
+            {"text": "Runs early", "category": "scheduling", "confidence": 0.8},
+            {"text": "Knee niggle", "category": "physical", "confidence": 0.9},
+            {"text": "Free on Sundays", "category": "scheduling", "confidence": 0.6},
+        ])
+        assert section.index("Runs early") < section.index("Free on Sundays")
+        assert "- Free on Sundays (confidence: 0.6)" in section
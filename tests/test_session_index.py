@@ -0,0 +1,114 @@
+"""Tests for the file-based session index (src.memory.session_index)."""
+
+import json
+
+from src.memory.session_index import (
+    INDEX_FILENAME,
+    MMAP_MIN_BYTES,
+    append_session_entry,
+    iter_jsonl,
+    list_sessions,
+    search_sessions,
+)
+
+
+def _write_session(sessions_dir, session_id, messages):
+    """Write a JSONL transcript and register it in the manifest."""
+    path = sessions_dir / f"{session_id}.jsonl"
+    with path.open("w", encoding="utf-8") as f:
+        for role, content in messages:
+            f.write(json.dumps({"ts": "2026-02-10T10:00:00", "role": role, "content": content}) + "\n")
+    append_session_entry(session_id, path, sessions_dir=sessions_dir)
+    return path
+
+
+class TestManifest:
+    def test_sessions_manifest_append_only(self, tmp_path):
+        """Each new session appends exactly one line; earlier bytes are untouched."""
+        append_session_entry("session_a", tmp_path / "session_a.jsonl", sessions_dir=tmp_path)
+        index_path = tmp_path / INDEX_FILENAME
+        before = index_path.read_bytes()
+
+        append_session_entry("session_b", tmp_path / "session_b.jsonl", sessions_dir=tmp_path)
+        after = index_path.read_bytes()
+
+        assert after.startswith(before)
+        new_lines = after[len(before):].decode().splitlines()
+        assert len(new_lines) == 1
+        assert json.loads(new_lines[0])["session_id"] == "session_b"
+
+    def test_entry_fields(self, tmp_path):
+        entry = append_session_entry(
+            "session_x", tmp_path / "session_x.jsonl", context="onboarding", sessions_dir=tmp_path,
+        )
+        assert entry["session_id"] == "session_x"
+        assert entry["jsonl_path"].endswith("session_x.jsonl")
+        assert entry["context"] == "onboarding"
+        assert entry["date"]
+
+    def test_list_sessions_newest_first(self, tmp_path):
+        for sid in ("s1", "s2", "s3"):
+            append_session_entry(sid, tmp_path / f"{sid}.jsonl", sessions_dir=tmp_path)
+
+        ids = [e["session_id"] for e in list_sessions(tmp_path)]
+        assert ids == ["s3", "s2", "s1"]
+
+    def test_list_sessions_missing_index(self, tmp_path):
+        assert list_sessions(tmp_path / "nope") == []
+
+    def test_list_sessions_skips_malformed_lines(self, tmp_path):
+        append_session_entry("good", tmp_path / "good.jsonl", sessions_dir=tmp_path)
+        with (tmp_path / INDEX_FILENAME).open("a") as f:
+            f.write('{"session_id": "trunc')
+
+        assert [e["session_id"] for e in list_sessions(tmp_path)] == ["good"]
+
+
+class TestSearchSessions:
+    def test_search_finds_transcript(self, tmp_path):
+        _write_session(tmp_path, "s1", [("user", "My knee hurts after long runs")])
+        _write_session(tmp_path, "s2", [("user", "Planning a marathon in October")])
+
+        results = search_sessions("MARATHON", sessions_dir=tmp_path)
+        assert len(results) == 1
+        assert results[0]["session_id"] == "s2"
+        assert "marathon" in results[0]["summary"]
+        assert results[0]["tags"] == []
+
+    def test_search_ignores_tool_calls(self, tmp_path):
+        _write_session(tmp_path, "s1", [("tool_call", '{"result": "marathon"}')])
+        assert search_sessions("marathon", sessions_dir=tmp_path) == []
+
+    def test_search_respects_limit(self, tmp_path):
+        for i in range(5):
+            _write_session(tmp_path, f"s{i}", [("model", "Easy run today")])
+
+        results = search_sessions("easy", limit=2, sessions_dir=tmp_path)
+        assert [r["session_id"] for r in results] == ["s4", "s3"]
+
+    def test_search_skips_missing_transcripts(self, tmp_path):
+        append_session_entry("ghost", tmp_path / "ghost.jsonl", sessions_dir=tmp_path)
+        assert search_sessions("anything", sessions_dir=tmp_path) == []
+
+    def test_search_large_transcript_uses_mmap_path(self, tmp_path):
+        filler = [("model", f"Easy aerobic run number {i}") for i in range(400)]
+        path = _write_session(tmp_path, "big", filler + [("user", "Tempo run on Thursday")])
+        assert path.stat().st_size >= MMAP_MIN_BYTES
+
+        results = search_sessions("tempo", sessions_dir=tmp_path)
+        assert [r["summary"] for r in results] == ["Tempo run on Thursday"]
+
+    def test_search_non_ascii_query(self, tmp_path):
+        filler = [("model", "x" * 100) for _ in range(200)]
+        _write_session(tmp_path, "s1", filler + [("user", "Lauf am Übermorgen")])
+
+        results = search_sessions("übermorgen", sessions_dir=tmp_path)
+        assert len(results) == 1
+
+
+class TestIterJsonl:
+    def test_streams_records_and_skips_bad_lines(self, tmp_path):
+        path = tmp_path / "t.jsonl"
+        path.write_text('{"a": 1}\n\nnot json\n{"a": 2}\n', encoding="utf-8")
+
+        assert list(iter_jsonl(path)) == [{"a": 1}, {"a": 2}]
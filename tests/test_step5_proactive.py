@@ -6,12 +6,16 @@ All queue operations are mocked via src.db.proactive_queue_db.
 
 from unittest.mock import patch
 
+import pytest
+
 from src.agent.trajectory import calculate_confidence
 from src.agent.proactive import (
     check_proactive_triggers,
     format_proactive_message,
     queue_proactive_message,
     get_pending_messages,
+    deliver_message,
+    record_engagement,
     refresh_proactive_triggers,
 )
 
@@ -79,6 +83,18 @@ def _mock_episodes():
     ]
 
 
+@pytest.fixture(scope="module")
+def profile():
+    """Shared athlete profile; trigger checks and formatters only read it."""
+    return _test_profile()
+
+
+@pytest.fixture(scope="module")
+def episodes():
+    """Shared mock episodes; trigger checks only read them."""
+    return _mock_episodes()
+
+
 # ── Confidence Scoring (unit tests, no API) ──────────────────────────
 
 class TestConfidenceScoring:
@@ -112,76 +128,76 @@ class TestConfidenceScoring:
 # ── Proactive Triggers (unit tests, no API) ──────────────────────────
 
 class TestProactiveTriggers:
-    def test_on_track_trigger(self):
+    def test_on_track_trigger(self, profile, episodes):
         trajectory = {
             "trajectory": {"on_track": True, "predicted_race_time": "1:43-1:48"},
             "confidence": 0.65,
             "goal": {"target_time": "1:45:00"},
         }
         triggers = check_proactive_triggers(
-            _test_profile(), [], _mock_episodes(), trajectory
+            profile, [], episodes, trajectory
         )
         types = [t["type"] for t in triggers]
         assert "on_track" in types
 
-    def test_goal_at_risk_trigger(self):
+    def test_goal_at_risk_trigger(self, profile, episodes):
         trajectory = {
             "trajectory": {"on_track": False, "predicted_race_time": "1:55-2:05"},
             "confidence": 0.6,
             "goal": {"target_time": "1:45:00"},
         }
         triggers = check_proactive_triggers(
-            _test_profile(), [], _mock_episodes(), trajectory
+            profile, [], episodes, trajectory
         )
         types = [t["type"] for t in triggers]
         assert "goal_at_risk" in types
 
-    def test_missed_session_pattern_trigger(self):
-        episodes = _mock_episodes()  # contain "Thursday" skip patterns
+    def test_missed_session_pattern_trigger(self, profile, episodes):
+        # episodes contain "Thursday" skip patterns
         trajectory = {
             "trajectory": {"on_track": True},
             "confidence": 0.5,
         }
         triggers = check_proactive_triggers(
-            _test_profile(), [], episodes, trajectory
+            profile, [], episodes, trajectory
         )
         types = [t["type"] for t in triggers]
         assert "missed_session_pattern" in types
 
-    def test_fitness_improving_trigger(self):
-        episodes = _mock_episodes()  # contain "increasing" volume trend
+    def test_fitness_improving_trigger(self, profile, episodes):
+        # episodes contain "increasing" volume trend
         trajectory = {
             "trajectory": {"on_track": True},
             "confidence": 0.5,
         }
         triggers = check_proactive_triggers(
-            _test_profile(), [], episodes, trajectory
+            profile, [], episodes, trajectory
         )
         types = [t["type"] for t in triggers]
         assert "fitness_improving" in types
 
 
 class TestProactiveMessages:
-    def test_on_track_message(self):
+    def test_on_track_message(self, profile):
         trigger = {"type": "on_track", "data": {"predicted_time": "1:43-1:48", "confidence": 0.65}}
-        msg = format_proactive_message(trigger, _test_profile())
+        msg = format_proactive_message(trigger, profile)
         assert "1:43-1:48" in msg
         assert "65%" in msg
 
-    def test_goal_at_risk_message(self):
+    def test_goal_at_risk_message(self, profile):
         trigger = {"type": "goal_at_risk", "data": {"predicted_time": "1:55-2:05", "target_time": "1:45:00"}}
-        msg = format_proactive_message(trigger, _test_profile())
+        msg = format_proactive_message(trigger, profile)
         assert "1:55-2:05" in msg
         assert "1:45:00" in msg
 
-    def test_missed_session_message(self):
+    def test_missed_session_message(self, profile):
         trigger = {"type": "missed_session_pattern", "data": {"day": "Thursday", "missed_count": 3}}
-        msg = format_proactive_message(trigger, _test_profile())
+        msg = format_proactive_message(trigger, profile)
         assert "Thursday" in msg
 
-    def test_fatigue_warning_message(self):
+    def test_fatigue_warning_message(self, profile):
         trigger = {"type": "fatigue_warning", "data": {"message": "fatigue detected"}}
-        msg = format_proactive_message(trigger, _test_profile())
+        msg = format_proactive_message(trigger, profile)
         assert "fatigue" in msg.lower()
 
 
@@ -221,25 +237,38 @@ class TestQueueRoundTrip:
         assert len(result) == 2
         assert result[0]["trigger_type"] == "goal_at_risk"
 
-    def test_queue_then_get_reflects_stored_message(self) -> None:
-        """Simulate queue → get round-trip via mocked DB."""
+    def test_queue_then_get_reflects_stored_message(self, memory_proactive_queue) -> None:
+        """Queue → get round-trip through the in-memory queue."""
         trigger = {
             "type": "fatigue_warning",
             "priority": "high",
             "data": {"message": "Tired"},
         }
-        db_row = {"id": "99", "trigger_type": "fatigue_warning", "priority": 0.9, "status": "pending"}
-
-        with patch("src.db.proactive_queue_db.queue_message", return_value=db_row):
-            queued = queue_proactive_message(USER_ID, trigger, priority=0.9)
 
-        # After queuing, the same row appears in pending list
-        with patch("src.db.proactive_queue_db.get_pending_messages", return_value=[queued]):
-            pending = get_pending_messages(USER_ID)
+        queued = queue_proactive_message(USER_ID, trigger, priority=0.9)
+        pending = get_pending_messages(USER_ID)
 
-        assert len(pending) == 1
+        assert pending == [queued]
         assert pending[0]["trigger_type"] == "fatigue_warning"
 
+    def test_full_queue_lifecycle(self, memory_proactive_queue) -> None:
+        """Queue two messages, deliver the most urgent, record engagement."""
+        queue_proactive_message(USER_ID, {"type": "on_track", "data": {}}, priority=0.2)
+        urgent = queue_proactive_message(
+            USER_ID, {"type": "goal_at_risk", "data": {}}, priority=0.9,
+        )
+
+        pending = get_pending_messages(USER_ID)
+        assert [m["trigger_type"] for m in pending] == ["goal_at_risk", "on_track"]
+
+        delivered = deliver_message(USER_ID, urgent["id"])
+        assert delivered["status"] == "delivered"
+        assert [m["trigger_type"] for m in get_pending_messages(USER_ID)] == ["on_track"]
+
+        engaged = record_engagement(USER_ID, urgent["id"], responded=True, turns_after=3)
+        assert engaged["engagement_tracking"]["session_turns_after_delivery"] == 3
+        assert engaged["engagement_tracking"]["user_responded_at"] is not None
+
 
 # ── Full cycle: trajectory → triggers → queue (DB-mocked) ────────────
 
@@ -250,10 +279,8 @@ class TestFullCycleTrajectoryToQueue:
     but replaces API calls and file I/O with mocks.
     """
 
-    def test_trajectory_assessment_produces_triggers(self) -> None:
+    def test_trajectory_assessment_produces_triggers(self, profile, episodes) -> None:
         """Meaningful trajectory data yields at least one trigger."""
-        profile = _test_profile()
-        episodes = _mock_episodes()
         trajectory = {
             "trajectory": {"on_track": False, "predicted_race_time": "2:00:00"},
             "confidence": 0.6,
@@ -263,9 +290,7 @@ class TestFullCycleTrajectoryToQueue:
         triggers = check_proactive_triggers(profile, [], episodes, trajectory)
         assert len(triggers) > 0
 
-    def test_triggers_have_meaningful_messages(self) -> None:
-        profile = _test_profile()
-        episodes = _mock_episodes()
+    def test_triggers_have_meaningful_messages(self, profile, episodes) -> None:
         trajectory = {
             "trajectory": {"on_track": False, "predicted_race_time": "2:00:00"},
             "confidence": 0.6,
@@ -278,10 +303,8 @@ class TestFullCycleTrajectoryToQueue:
             assert isinstance(msg, str)
             assert len(msg) > 10
 
-    def test_refresh_queues_all_new_triggers(self) -> None:
+    def test_refresh_queues_all_new_triggers(self, profile, episodes) -> None:
         """refresh_proactive_triggers queues every trigger not already pending."""
-        profile = _test_profile()
-        episodes = _mock_episodes()
         trajectory = {
             "trajectory": {"on_track": False, "predicted_race_time": "2:00:00"},
             "confidence": 0.6,
@@ -310,10 +333,8 @@ class TestFullCycleTrajectoryToQueue:
         assert len(result) == queued_count
         assert queued_count > 0
 
-    def test_refresh_skips_already_pending_triggers(self) -> None:
+    def test_refresh_skips_already_pending_triggers(self, profile, episodes) -> None:
         """If goal_at_risk is already pending, it must not be re-queued."""
-        profile = _test_profile()
-        episodes = _mock_episodes()
         trajectory = {
             "trajectory": {"on_track": False, "predicted_race_time": "2:00:00"},
             "confidence": 0.6,
@@ -1,23 +1,57 @@
 """Tests for Step 6 Phase A: UserModel and Belief Storage."""
 
+import copy
+import itertools
 import json
+import sys
+import threading
 import pytest
 from pathlib import Path
-from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
 
+from src.agent.prompts import build_plan_prompt
 from src.memory.user_model import UserModel, BELIEF_CATEGORIES
+from tests.helpers import FROZEN_NOW, freeze_datetime
 
 
 # ── Fixtures ─────────────────────────────────────────────────────
 
 
+_NOW_REF = FROZEN_NOW
+_NOW_ISO = _NOW_REF.isoformat(timespec="seconds")
+_TODAY_ISO = _NOW_REF.date().isoformat()
+_OLD_DATE_40D = (_NOW_REF - timedelta(days=40)).isoformat(timespec="seconds")
+
+
+@pytest.fixture(autouse=True)
+def _frozen_now(monkeypatch):
+    """Pin user_model's clock to _NOW_REF, with its ISO strings precomputed."""
+    freeze_datetime(monkeypatch, "src.memory.user_model")
+    monkeypatch.setattr("src.memory.user_model._now_iso", lambda: _NOW_ISO)
+    monkeypatch.setattr("src.memory.user_model._today_iso", lambda: _TODAY_ISO)
+
+
+_model_dir_ids = itertools.count()
+
+
+@pytest.fixture(scope="module")
+def _model_root(tmp_path_factory):
+    """One temp root per module; each test's model dir is a unique child of it."""
+    return tmp_path_factory.mktemp("user_models")
+
+
 @pytest.fixture
-def tmp_model_dir(tmp_path):
-    """Provide a temporary directory for user model storage."""
-    model_dir = tmp_path / "user_model"
-    model_dir.mkdir()
-    return model_dir
+def tmp_model_dir(_model_root):
+    """Provide a temporary directory path for user model storage.
+
+    The directory is not created up front: UserModel.save() and the archive
+    writer create it on first write, so read-only tests never touch disk.
+    Paths are unique per test under a shared root, which avoids creating a
+    tmp_path directory for every test that only needs a blank model.
+    """
+    return _model_root / f"user_model_{next(_model_dir_ids)}"
 
 
 @pytest.fixture
@@ -26,42 +60,84 @@ def model(tmp_model_dir):
     return UserModel(data_dir=tmp_model_dir)
 
 
-@pytest.fixture
-def populated_model(model):
-    """Create a UserModel with structured_core and several beliefs."""
-    model.update_structured_core("name", "Test Athlete")
-    model.update_structured_core("sports", ["running"])
-    model.update_structured_core("goal.event", "Half Marathon")
-    model.update_structured_core("goal.target_date", "2026-10-15")
-    model.update_structured_core("goal.target_time", "1:45:00")
-    model.update_structured_core("constraints.training_days_per_week", 5)
-    model.update_structured_core("constraints.max_session_minutes", 90)
-    model.update_structured_core("constraints.available_sports", ["running"])
-
-    model.add_belief("Prefers morning training before work", "scheduling", confidence=0.8)
-    model.add_belief("Had knee injury 2 years ago, flares up after 15km+", "physical", confidence=0.9)
-    model.add_belief("Motivated by race goals, not general fitness", "motivation", confidence=0.7)
-    model.add_belief("Sleeps poorly on Sundays before work week", "constraint", confidence=0.6)
+@pytest.fixture(scope="module")
+def readonly_model(tmp_path_factory):
+    """One empty UserModel per module, for tests that only inspect defaults."""
+    return UserModel(data_dir=tmp_path_factory.mktemp("readonly_user_model"))
+
+
+@pytest.fixture(scope="session")
+def _template_populated_model(tmp_path_factory):
+    """Build the populated UserModel once per session; tests get deep copies."""
+    model = UserModel(data_dir=tmp_path_factory.mktemp("template_user_model"))
+    model.update_structured_core_bulk({
+        "name": "Test Athlete",
+        "sports": ["running"],
+        "goal.event": "Half Marathon",
+        "goal.target_date": "2026-10-15",
+        "goal.target_time": "1:45:00",
+        "constraints.training_days_per_week": 5,
+        "constraints.max_session_minutes": 90,
+        "constraints.available_sports": ["running"],
+    })
+
+    model.add_beliefs([
+        {"text": "Prefers morning training before work", "category": "scheduling", "confidence": 0.8},
+        {"text": "Had knee injury 2 years ago, flares up after 15km+", "category": "physical", "confidence": 0.9},
+        {"text": "Motivated by race goals, not general fitness", "category": "motivation", "confidence": 0.7},
+        {"text": "Sleeps poorly on Sundays before work week", "category": "constraint", "confidence": 0.6},
+    ])
 
     return model
 
 
+@pytest.fixture
+def populated_model(model, _template_populated_model):
+    """Create a UserModel with structured_core and several beliefs.
+
+    State is deep-copied from the session template into a model bound to
+    this test's tmp storage, so mutations never leak between tests.
+    """
+    template = _template_populated_model
+    model.structured_core = copy.deepcopy(template.structured_core)
+    model.beliefs = copy.deepcopy(template.beliefs)
+    model.meta = copy.deepcopy(template.meta)
+    model.core_version = template.core_version
+    return model
+
+
+@pytest.fixture(scope="class")
+def readonly_populated_model(_template_populated_model):
+    """The session template itself, shared across a class without copying.
+
+    Only for tests that read (summaries, projections, belief queries). Any
+    test that mutates the model or saves it must use populated_model.
+    """
+    return _template_populated_model
+
+
+@pytest.fixture(scope="class")
+def populated_summary(readonly_populated_model):
+    """get_model_summary() of the shared populated model, rendered once per class."""
+    return readonly_populated_model.get_model_summary()
+
+
 # ── UserModel Initialization ─────────────────────────────────────
 
 
 class TestUserModelInit:
-    def test_creates_with_empty_structured_core(self, model):
-        assert model.structured_core["name"] is None
-        assert model.structured_core["sports"] == []
-        assert model.structured_core["goal"]["event"] is None
+    def test_creates_with_empty_structured_core(self, readonly_model):
+        assert readonly_model.structured_core["name"] is None
+        assert readonly_model.structured_core["sports"] == []
+        assert readonly_model.structured_core["goal"]["event"] is None
 
-    def test_creates_with_empty_beliefs(self, model):
-        assert model.beliefs == []
+    def test_creates_with_empty_beliefs(self, readonly_model):
+        assert readonly_model.beliefs == []
 
-    def test_meta_has_timestamps(self, model):
-        assert "created_at" in model.meta
-        assert "updated_at" in model.meta
-        assert model.meta["sessions_completed"] == 0
+    def test_meta_has_timestamps(self, readonly_model):
+        assert "created_at" in readonly_model.meta
+        assert "updated_at" in readonly_model.meta
+        assert readonly_model.meta["sessions_completed"] == 0
 
 
 # ── Belief CRUD ──────────────────────────────────────────────────
@@ -100,19 +176,78 @@ class TestBeliefCRUD:
         assert len(model.beliefs) == 1
         assert model.beliefs[0]["text"] == "Test belief"
 
-    def test_add_belief_clamps_confidence(self, model):
-        b1 = model.add_belief("High conf", "preference", confidence=1.5)
-        b2 = model.add_belief("Low conf", "preference", confidence=-0.3)
-        assert b1["confidence"] == 1.0
-        assert b2["confidence"] == 0.0
-
-    def test_add_belief_invalid_category_defaults_to_preference(self, model):
-        belief = model.add_belief("Test", "nonexistent_category")
-        assert belief["category"] == "preference"
-
-    def test_add_belief_session_durability(self, model):
-        belief = model.add_belief("Tired today", "physical", durability="session")
-        assert belief["durability"] == "session"
+    def test_add_beliefs_creates_each_in_order(self, model):
+        created = model.add_beliefs([
+            {"text": "Runs early", "category": "scheduling"},
+            {"text": "Old knee issue", "category": "physical", "confidence": 0.9},
+        ])
+        assert [b["text"] for b in model.beliefs] == ["Runs early", "Old knee issue"]
+        assert created == model.beliefs
+        assert created[1]["confidence"] == 0.9
+
+    def test_db_add_beliefs_inserts_once(self):
+        from src.db.user_model_db import UserModelDB
+
+        with patch("src.db.user_model_db.get_supabase") as mock_get_sb:
+            db_model = UserModelDB(user_id="user-1")
+        table = mock_get_sb.return_value.table.return_value
+        table.insert.return_value.execute.return_value = SimpleNamespace(data=[
+            {"id": "b-1", "text": "Runs early", "category": "scheduling"},
+            {"id": "b-2", "text": "Old knee issue", "category": "physical"},
+        ])
+
+        created = db_model.add_beliefs([
+            {"text": "Runs early", "category": "scheduling", "embedding": [0.1]},
+            {"text": "Old knee issue", "category": "physical", "embedding": [0.2]},
+        ])
+
+        table.insert.assert_called_once()
+        rows = table.insert.call_args.args[0]
+        assert [r["text"] for r in rows] == ["Runs early", "Old knee issue"]
+        assert [b["id"] for b in created] == ["b-1", "b-2"]
+        assert db_model.beliefs == created
+
+    def test_db_batch_and_single_rows_share_defaults(self):
+        from src.db.user_model_db import UserModelDB
+
+        with patch("src.db.user_model_db.get_supabase") as mock_get_sb:
+            db_model = UserModelDB(user_id="user-1")
+        table = mock_get_sb.return_value.table.return_value
+        table.insert.return_value.execute.return_value = SimpleNamespace(data=[
+            {"id": "b-1", "text": "Runs early", "category": "scheduling"},
+        ])
+        spec = {"text": "Runs early", "category": "scheduling", "embedding": [0.1]}
+
+        db_model.add_belief(**spec)
+        single_row = table.insert.call_args.args[0]
+        db_model.add_beliefs([spec])
+        batch_row = table.insert.call_args.args[0][0]
+
+        assert batch_row == single_row
+
+    @pytest.mark.parametrize("raw,expected", [
+        (1.5, 1.0), (-0.3, 0.0), (0.5, 0.5), (0.0, 0.0), (1.0, 1.0),
+    ])
+    def test_add_belief_clamps_confidence(self, model, raw, expected):
+        assert model.add_belief("Conf", "preference", confidence=raw)["confidence"] == expected
+
+    @pytest.mark.parametrize("category,expected", [
+        ("physical", "physical"),
+        ("nonexistent_category", "preference"),
+    ])
+    def test_add_belief_category(self, model, category, expected):
+        assert model.add_belief("Test", category)["category"] == expected
+
+    def test_add_belief_interns_category(self, model):
+        # Built at runtime so the argument is not the interned literal.
+        category = "".join(["sched", "uling"])
+        belief = model.add_belief("Trains at lunch", category)
+        assert belief["category"] is sys.intern("scheduling")
+
+    @pytest.mark.parametrize("durability", ["session", "global"])
+    def test_add_belief_durability(self, model, durability):
+        belief = model.add_belief("Tired today", "physical", durability=durability)
+        assert belief["durability"] == durability
 
     def test_update_belief_text(self, model):
         belief = model.add_belief("Runs 4 days/week", "scheduling", confidence=0.7)
@@ -160,18 +295,17 @@ class TestBeliefCRUD:
     def test_invalidate_nonexistent_returns_none(self, model):
         assert model.invalidate_belief("belief_nope") is None
 
-    def test_get_active_beliefs_all(self, populated_model):
-        active = populated_model.get_active_beliefs()
-        assert len(active) == 4
-        assert all(b["active"] for b in active)
+    def test_get_active_beliefs_all(self, readonly_populated_model):
+        active = readonly_populated_model.get_active_beliefs()
+        assert [b["active"] for b in active] == [True] * 4
 
-    def test_get_active_beliefs_by_category(self, populated_model):
-        physical = populated_model.get_active_beliefs(category="physical")
+    def test_get_active_beliefs_by_category(self, readonly_populated_model):
+        physical = readonly_populated_model.get_active_beliefs(category="physical")
         assert len(physical) == 1
         assert physical[0]["category"] == "physical"
 
-    def test_get_active_beliefs_by_min_confidence(self, populated_model):
-        high_conf = populated_model.get_active_beliefs(min_confidence=0.8)
+    def test_get_active_beliefs_by_min_confidence(self, readonly_populated_model):
+        high_conf = readonly_populated_model.get_active_beliefs(min_confidence=0.8)
         assert len(high_conf) == 2  # 0.8 and 0.9
 
     def test_get_active_beliefs_excludes_inactive(self, model):
@@ -188,36 +322,68 @@ class TestBeliefCRUD:
 
 
 class TestStructuredCore:
-    def test_update_top_level_field(self, model):
-        model.update_structured_core("name", "Roman")
-        assert model.structured_core["name"] == "Roman"
+    @pytest.mark.parametrize("path,value", [
+        pytest.param("name", "Roman", id="top_level"),
+        pytest.param("goal.event", "Marathon", id="nested"),
+        pytest.param("fitness.estimated_vo2max", 52.5, id="deep_nested"),
+        pytest.param("new_section.sub_field", "value", id="creates_intermediate_dicts"),
+    ])
+    def test_update_field(self, model, path, value):
+        model.update_structured_core(path, value)
+
+        target = model.structured_core
+        for part in path.split("."):
+            target = target[part]
+        assert target == value
+
+    def test_initial_core_merges_into_defaults(self, tmp_model_dir):
+        model = UserModel(
+            data_dir=tmp_model_dir,
+            initial_core={
+                "sports": ["running"],
+                "goal": {"event": "Marathon"},
+                "constraints": {"training_days_per_week": 4},
+            },
+        )
+        assert model.structured_core["sports"] == ["running"]
+        assert model.structured_core["goal"]["event"] == "Marathon"
+        assert model.structured_core["goal"]["target_date"] is None
+        assert model.structured_core["constraints"]["training_days_per_week"] == 4
+        assert model.structured_core["constraints"]["available_sports"] == []
 
-    def test_update_nested_field(self, model):
-        model.update_structured_core("goal.event", "Marathon")
+    def test_bulk_update_applies_all_fields(self, model):
+        model.update_structured_core_bulk({"name": "Roman", "goal.event": "Marathon"})
+        assert model.structured_core["name"] == "Roman"
         assert model.structured_core["goal"]["event"] == "Marathon"
 
-    def test_update_deep_nested_field(self, model):
-        model.update_structured_core("fitness.estimated_vo2max", 52.5)
-        assert model.structured_core["fitness"]["estimated_vo2max"] == 52.5
+    def test_db_bulk_update_saves_once(self):
+        from src.db.user_model_db import UserModelDB
 
-    def test_update_creates_intermediate_dicts(self, model):
-        model.update_structured_core("new_section.sub_field", "value")
-        assert model.structured_core["new_section"]["sub_field"] == "value"
+        with patch("src.db.user_model_db.get_supabase"):
+            db_model = UserModelDB(user_id="user-1")
+        with patch.object(db_model, "save") as mock_save:
+            db_model.update_structured_core_bulk({
+                "name": "Roman",
+                "sports": ["running"],
+                "constraints.training_days_per_week": 4,
+            })
+        mock_save.assert_called_once()
+        assert db_model.structured_core["constraints"]["training_days_per_week"] == 4
 
 
 # ── Model Summary ────────────────────────────────────────────────
 
 
 class TestModelSummary:
-    def test_summary_includes_core_info(self, populated_model):
-        summary = populated_model.get_model_summary()
+    def test_summary_includes_core_info(self, populated_summary):
+        summary = populated_summary
         assert "Test Athlete" in summary
         assert "running" in summary
         assert "Half Marathon" in summary
         assert "2026-10-15" in summary
 
-    def test_summary_includes_beliefs(self, populated_model):
-        summary = populated_model.get_model_summary()
+    def test_summary_includes_beliefs(self, populated_summary):
+        summary = populated_summary
         assert "COACH'S NOTES" in summary
         assert "morning training" in summary
         assert "knee injury" in summary
@@ -230,8 +396,35 @@ class TestModelSummary:
         assert "High conf note" in summary
         assert "Low conf note" not in summary
 
-    def test_summary_empty_model(self, model):
-        summary = model.get_model_summary()
+    def test_summary_belief_lines_indented_under_category(self, model):
+        model.add_belief("Trail runs on Sundays", "scheduling", confidence=0.8)
+        model.add_belief("Responds to pace targets", "meta", confidence=0.7)
+
+        lines = model.get_model_summary().splitlines()
+        notes = lines[lines.index("COACH'S NOTES ON THIS ATHLETE:") + 1:]
+        assert notes == [
+            "  [META]",
+            "  - Responds to pace targets (confidence: 0.7)",
+            "  [SCHEDULING]",
+            "  - Trail runs on Sundays (confidence: 0.8)",
+        ]
+
+    def test_summary_reused_until_model_changes(self, model):
+        model.add_belief("Prefers trails", "preference", confidence=0.8)
+        first = model.get_model_summary()
+        assert model.get_model_summary() is first
+
+        belief = model.add_belief("Rest on Fridays", "scheduling", confidence=0.8)
+        assert "Rest on Fridays" in model.get_model_summary()
+
+        model.invalidate_belief(belief["id"])
+        assert "Rest on Fridays" not in model.get_model_summary()
+
+        model.update_structured_core("name", "Lena")
+        assert "Athlete: Lena" in model.get_model_summary()
+
+    def test_summary_empty_model(self, readonly_model):
+        summary = readonly_model.get_model_summary()
         assert isinstance(summary, str)
         # Should not crash, just have less content
 
@@ -240,8 +433,8 @@ class TestModelSummary:
 
 
 class TestProjectProfile:
-    def test_project_profile_structure(self, populated_model):
-        profile = populated_model.project_profile()
+    def test_project_profile_structure(self, readonly_populated_model):
+        profile = readonly_populated_model.project_profile()
 
         assert profile["name"] == "Test Athlete"
         assert profile["sports"] == ["running"]
@@ -253,18 +446,16 @@ class TestProjectProfile:
         assert "created_at" in profile
         assert "updated_at" in profile
 
-    def test_project_profile_defaults(self, model):
+    def test_project_profile_defaults(self, readonly_model):
         """An empty model should still produce a valid profile with defaults."""
-        profile = model.project_profile()
+        profile = readonly_model.project_profile()
         assert profile["name"] == "Athlete"
         assert profile["constraints"]["training_days_per_week"] == 5
         assert profile["constraints"]["max_session_minutes"] == 90
 
-    def test_project_profile_compatible_with_plan_prompt(self, populated_model):
+    def test_project_profile_compatible_with_plan_prompt(self, readonly_populated_model):
         """Verify the projected profile can be passed to build_plan_prompt."""
-        from src.agent.prompts import build_plan_prompt
-
-        profile = populated_model.project_profile()
+        profile = readonly_populated_model.project_profile()
         prompt = build_plan_prompt(profile)
 
         assert isinstance(prompt, str)
@@ -280,10 +471,14 @@ class TestPersistence:
     def test_save_creates_file(self, populated_model, tmp_model_dir):
         path = populated_model.save()
         assert path.exists()
-        data = json.loads(path.read_text())
-        assert "structured_core" in data
-        assert "beliefs" in data
-        assert "meta" in data
+        # The one on-disk format check; other tests compare in-memory state
+        assert json.loads(path.read_text()) == populated_model.to_dict()
+
+    def test_to_dict_holds_persisted_sections(self, populated_model):
+        data = populated_model.to_dict()
+        assert set(data) == {"structured_core", "beliefs", "meta"}
+        assert data["beliefs"] is populated_model.beliefs
+        assert data["structured_core"]["name"] == "Test Athlete"
 
     def test_save_load_roundtrip(self, populated_model, tmp_model_dir):
         populated_model.save()
@@ -294,6 +489,8 @@ class TestPersistence:
         assert loaded.structured_core["name"] == "Test Athlete"
         assert len(loaded.beliefs) == 4
         assert loaded.meta["sessions_completed"] == 0
+        for belief in loaded.beliefs:
+            assert belief["category"] is sys.intern(belief["category"])
 
     def test_load_nonexistent_raises(self, tmp_model_dir):
         model = UserModel(data_dir=tmp_model_dir / "nonexistent")
@@ -311,28 +508,45 @@ class TestPersistence:
         assert model.structured_core["name"] is None
         assert model.beliefs == []
 
+    def test_in_memory_model_roundtrip_without_disk(self, memory_user_model):
+        memory_user_model.update_structured_core("name", "Roman")
+        memory_user_model.add_belief("Runs early", "scheduling")
+        memory_user_model.save()
+
+        memory_user_model.update_structured_core("name", "Changed")
+        memory_user_model.load()
+
+        assert memory_user_model.structured_core["name"] == "Roman"
+        assert len(memory_user_model.beliefs) == 1
+        assert not memory_user_model._model_path.exists()
+
 
 # ── Prune Stale Beliefs ─────────────────────────────────────────
 
 
 class TestPruneStaleBeliefs:
-    def test_prune_session_beliefs(self, model):
+    # Tests that archive but do not inspect the archive file run against the
+    # in-memory model; test_prune_writes_archive_file keeps the disk check.
+
+    def test_prune_session_beliefs(self, memory_user_model):
+        model = memory_user_model
         model.add_belief("Tired today", "physical", durability="session")
         model.add_belief("Global info", "preference", durability="global")
 
         archived = model.prune_stale_beliefs()
         assert len(archived) == 1
         assert archived[0]["durability"] == "session"
+        assert [b["text"] for b in model.archive] == ["Tired today"]
 
         active = model.get_active_beliefs()
         assert len(active) == 1
         assert active[0]["text"] == "Global info"
 
-    def test_prune_low_confidence_stale(self, model):
+    def test_prune_low_confidence_stale(self, memory_user_model):
+        model = memory_user_model
         belief = model.add_belief("Old uncertain info", "preference", confidence=0.3)
-        # Manually backdate last_confirmed to 40 days ago
-        old_date = (datetime.now() - timedelta(days=40)).isoformat(timespec="seconds")
-        belief["last_confirmed"] = old_date
+        # Manually backdate last_confirmed to 40 days before _NOW_REF
+        belief["last_confirmed"] = _OLD_DATE_40D
 
         archived = model.prune_stale_beliefs(max_age_days=30, min_confidence=0.5)
         assert len(archived) == 1
@@ -363,33 +577,120 @@ class TestPruneStaleBeliefs:
 # ── Embedding & Similarity (mocked) ─────────────────────────────
 
 
+def _embedding_response(values: list[float]) -> SimpleNamespace:
+    """Build an embed_content() response carrying one embedding."""
+    return SimpleNamespace(embeddings=[SimpleNamespace(values=values)])
+
+
+class _FakeEmbedClient:
+    """Stand-in for the genai client exposing only models.embed_content().
+
+    Records each call's kwargs in ``requests`` (list.append is thread-safe,
+    so concurrent embed_beliefs() calls are counted correctly).
+    """
+
+    def __init__(self, values: list[float] | None = None, embed=None):
+        self.requests: list[dict] = []
+        self._embed = embed or (lambda **kwargs: _embedding_response(values))
+        self.models = SimpleNamespace(embed_content=self._embed_content)
+
+    def _embed_content(self, **kwargs):
+        self.requests.append(kwargs)
+        return self._embed(**kwargs)
+
+
+def _inject_beliefs(model, n: int, embedding_dim: int = 5) -> list[dict]:
+    """Assign n active preference beliefs directly, bypassing add_belief().
+
+    Ids and timestamps are fixed; belief i gets the embedding [i / n] *
+    embedding_dim, or None when embedding_dim is 0.
+    """
+    model.beliefs = [
+        {
+            "id": f"belief_{i}",
+            "text": f"Belief {i}",
+            "category": "preference",
+            "confidence": 0.7,
+            "first_observed": _NOW_ISO,
+            "last_confirmed": _NOW_ISO,
+            "valid_from": _TODAY_ISO,
+            "valid_until": None,
+            "active": True,
+            "embedding": [float(i) / n] * embedding_dim if embedding_dim else None,
+        }
+        for i in range(n)
+    ]
+    return model.beliefs
+
+
+@pytest.fixture(scope="class")
+def _get_client_patch(request):
+    """Patch user_model.get_client once per test class."""
+    patcher = patch("src.memory.user_model.get_client")
+    mock = patcher.start()
+    request.addfinalizer(patcher.stop)
+    return mock
+
+
+@pytest.fixture
+def get_client(_get_client_patch):
+    """The class-wide get_client mock, reset for each test."""
+    _get_client_patch.reset_mock(return_value=True, side_effect=True)
+    return _get_client_patch
+
+
 class TestEmbeddingMocked:
-    def test_embed_belief_calls_api(self, model):
+    def test_embed_belief_calls_api(self, model, get_client):
         belief = model.add_belief("Test belief", "preference")
 
-        mock_response = MagicMock()
-        mock_embedding = MagicMock()
-        mock_embedding.values = [0.1, 0.2, 0.3, 0.4, 0.5]
-        mock_response.embeddings = [mock_embedding]
+        mock_client = _FakeEmbedClient([0.1, 0.2, 0.3, 0.4, 0.5])
 
-        mock_client = MagicMock()
-        mock_client.models.embed_content.return_value = mock_response
-
-        with patch("src.memory.user_model.get_client", return_value=mock_client):
-            result = model.embed_belief(belief)
+        get_client.return_value = mock_client
+        result = model.embed_belief(belief)
 
         assert result == [0.1, 0.2, 0.3, 0.4, 0.5]
         assert belief["embedding"] == [0.1, 0.2, 0.3, 0.4, 0.5]
 
-    def test_embed_belief_handles_api_failure(self, model):
+    def test_embed_belief_handles_api_failure(self, model, get_client):
         belief = model.add_belief("Test belief", "preference")
 
-        with patch("src.memory.user_model.get_client", side_effect=Exception("API error")):
-            result = model.embed_belief(belief)
+        get_client.side_effect = Exception("API error")
+        result = model.embed_belief(belief)
 
         assert result is None
         assert belief["embedding"] is None
 
+    def test_embed_beliefs_parallel_embeddings(self, model, get_client):
+        """All missing embeddings are fetched, concurrently rather than serially."""
+        for i in range(8):
+            model.add_belief(f"Belief {i}", "preference")
+
+        # Each call waits until all eight have started, so a serial pool
+        # would time out at the barrier instead of embedding every belief.
+        barrier = threading.Barrier(8, timeout=5)
+
+        def _slow_embed(**kwargs):
+            barrier.wait()
+            return _embedding_response([0.1, 0.2, 0.3])
+
+        mock_client = _FakeEmbedClient(embed=_slow_embed)
+
+        get_client.return_value = mock_client
+        count = model.embed_beliefs()
+
+        assert count == 8
+        assert len(mock_client.requests) == 8
+        assert [b["embedding"] for b in model.beliefs] == [[0.1, 0.2, 0.3]] * 8
+
+    def test_embed_beliefs_skips_already_embedded(self, model, get_client):
+        done = model.add_belief("Has embedding", "preference", embedding=[1.0, 0.0])
+        model.add_belief("Needs embedding", "preference")
+
+        get_client.side_effect = Exception("API error")
+        assert model.embed_beliefs() == 0
+
+        assert done["embedding"] == [1.0, 0.0]
+
     def test_find_similar_fallback_for_few_beliefs(self, model):
         """When < 10 beliefs, returns all active beliefs without embeddings."""
         model.add_belief("Belief 1", "preference")
@@ -397,40 +698,30 @@ class TestEmbeddingMocked:
         model.add_belief("Belief 3", "physical")
 
         results = model.find_similar_beliefs("some candidate text")
-        assert len(results) == 3
         # All should have similarity 1.0 (fallback)
-        assert all(score == 1.0 for _, score in results)
+        sims = [score for _, score in results]
+        assert sims == [1.0] * 3
 
-    def test_find_similar_with_embeddings(self, model):
+    def test_find_similar_with_embeddings(self, model, get_client):
         """When >= 10 beliefs with embeddings, uses cosine similarity."""
-        # Add 10+ beliefs with embeddings
-        for i in range(12):
-            b = model.add_belief(f"Belief {i}", "preference")
-            b["embedding"] = [float(i) / 12] * 5  # simple embedding
-
-        mock_response = MagicMock()
-        mock_embedding = MagicMock()
-        mock_embedding.values = [0.5] * 5  # candidate embedding
-        mock_response.embeddings = [mock_embedding]
+        _inject_beliefs(model, 12)
 
-        mock_client = MagicMock()
-        mock_client.models.embed_content.return_value = mock_response
+        mock_client = _FakeEmbedClient([0.5] * 5)  # candidate embedding
 
-        with patch("src.memory.user_model.get_client", return_value=mock_client):
-            results = model.find_similar_beliefs("candidate text", top_k=3)
+        get_client.return_value = mock_client
+        results = model.find_similar_beliefs("candidate text", top_k=3)
 
         assert len(results) == 3
         # Results should be sorted by similarity descending
         sims = [score for _, score in results]
         assert sims == sorted(sims, reverse=True)
 
-    def test_find_similar_handles_api_failure(self, model):
+    def test_find_similar_handles_api_failure(self, model, get_client):
         """Falls back to returning all beliefs if embedding API fails."""
-        for i in range(12):
-            model.add_belief(f"Belief {i}", "preference")
+        _inject_beliefs(model, 12, embedding_dim=0)
 
-        with patch("src.memory.user_model.get_client", side_effect=Exception("API error")):
-            results = model.find_similar_beliefs("candidate text")
+        get_client.side_effect = Exception("API error")
+        results = model.find_similar_beliefs("candidate text")
 
         assert len(results) == 12  # all active beliefs returned as fallback
 
@@ -438,10 +729,13 @@ class TestEmbeddingMocked:
 # ── Belief Categories ────────────────────────────────────────────
 
 
+_EXPECTED_CATEGORIES = frozenset({
+    "preference", "constraint", "history", "motivation",
+    "physical", "fitness", "scheduling", "personality", "meta",
+})
+
+
+@pytest.mark.smoke
 class TestBeliefCategories:
     def test_all_expected_categories_exist(self):
-        expected = {
-            "preference", "constraint", "history", "motivation",
-            "physical", "fitness", "scheduling", "personality", "meta",
-        }
-        assert BELIEF_CATEGORIES == expected
+        assert frozenset(BELIEF_CATEGORIES) == _EXPECTED_CATEGORIES
@@ -4,20 +4,32 @@ Tests meta-belief extraction from reflection cycles and their injection
 into future coaching behavior via the PrefEval pattern.
 """
 
+import asyncio
 import json
+import threading
+
 import pytest
+from functools import lru_cache
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from src.memory.episodes import extract_meta_beliefs, META_REFLECTION_PROMPT
-from src.memory.user_model import UserModel
+from src.memory.episodes import (
+    _META_CACHE,
+    _META_USER_PREFIX,
+    extract_meta_beliefs,
+    extract_meta_beliefs_async,
+    extract_meta_beliefs_batch,
+    META_REFLECTION_PROMPT,
+)
 
 
 # -- Fixtures -----------------------------------------------------------------
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_episode():
+    """A completed reflection episode; read-only, so shared module-wide."""
     return {
         "id": "ep_2026-02-03",
         "block": "2026-W06",
@@ -45,22 +57,70 @@ def sample_episode():
     }
 
 
-def _mock_litellm_response(response_json: dict) -> MagicMock:
-    """Create a mock LiteLLM response object (OpenAI-compatible)."""
-    mock_response = MagicMock()
-    mock_message = MagicMock()
-    mock_message.content = json.dumps(response_json)
-    mock_choice = MagicMock()
-    mock_choice.message = mock_message
-    mock_response.choices = [mock_choice]
-    return mock_response
+# Response bodies shared by several tests, serialized once at import.
+_CANNED_RESPONSES: dict[str, str] = {
+    "no_insights": json.dumps({"meta_beliefs": []}, sort_keys=True),
+    "malformed": "not json at all",
+    "fenced": '```json\n{"meta_beliefs": [{"text": "Insight", "category": "meta",}]}\n```',
+}
+
+
+def _canned_response(key: str) -> SimpleNamespace:
+    """Return the mock LiteLLM response for a pre-serialized body."""
+    return _mock_litellm_response_cached(_CANNED_RESPONSES[key])
+
+
+def _mock_litellm_response(response_json: dict) -> SimpleNamespace:
+    """Create a mock LiteLLM response object (OpenAI-compatible).
+
+    Responses are memoized on the serialized payload; callers only read
+    ``choices[0].message.content``, so a shared SimpleNamespace is enough.
+    """
+    return _mock_litellm_response_cached(json.dumps(response_json, sort_keys=True))
+
+
+@lru_cache(maxsize=64)
+def _mock_litellm_response_cached(content: str) -> SimpleNamespace:
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _clear_mock_response_cache():
+    """Drop memoized mock responses when this module's tests finish."""
+    yield
+    _mock_litellm_response_cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def _clear_meta_cache():
+    """Start every test with an empty meta-reflection cache.
+
+    Tests here reuse sample_episode with different mocked responses, so the
+    module-level reset in conftest is not enough.
+    """
+    _META_CACHE.clear()
+
+
+@pytest.fixture(scope="class")
+def _completion_patch(request):
+    """Patch episodes.chat_completion once per test class."""
+    patcher = patch("src.memory.episodes.chat_completion")
+    mock = patcher.start()
+    request.addfinalizer(patcher.stop)
+    return mock
+
+
+@pytest.fixture
+def mock_completion(_completion_patch):
+    """The class-wide chat_completion mock, reset for each test."""
+    _completion_patch.reset_mock(return_value=True, side_effect=True)
+    return _completion_patch
 
 
 # -- extract_meta_beliefs -----------------------------------------------------
 
 
 class TestExtractMetaBeliefs:
-    @patch("src.memory.episodes.chat_completion")
     def test_extracts_meta_beliefs(self, mock_completion, sample_episode):
         mock_completion.return_value = _mock_litellm_response({
             "meta_beliefs": [
@@ -84,31 +144,38 @@ class TestExtractMetaBeliefs:
         assert beliefs[0]["category"] == "meta"
         assert "zone discipline" in beliefs[0]["text"]
 
-    @patch("src.memory.episodes.chat_completion")
     def test_returns_empty_for_no_insights(self, mock_completion, sample_episode):
-        mock_completion.return_value = _mock_litellm_response({
-            "meta_beliefs": []
-        })
+        mock_completion.return_value = _canned_response("no_insights")
 
         beliefs = extract_meta_beliefs(sample_episode)
         assert beliefs == []
 
-    @patch("src.memory.episodes.chat_completion")
     def test_handles_malformed_response(self, mock_completion, sample_episode):
-        mock_response = MagicMock()
-        mock_message = MagicMock()
-        mock_message.content = "not json at all"
-        mock_choice = MagicMock()
-        mock_choice.message = mock_message
-        mock_response.choices = [mock_choice]
-        mock_completion.return_value = mock_response
+        mock_completion.return_value = _canned_response("malformed")
 
         beliefs = extract_meta_beliefs(sample_episode)
         assert beliefs == []
 
-    @patch("src.memory.episodes.chat_completion")
+    def test_skips_llm_for_empty_episode(self, mock_completion, sample_episode):
+        episode = {
+            **sample_episode,
+            "key_observations": [],
+            "lessons": [],
+            "patterns_detected": [],
+        }
+
+        assert extract_meta_beliefs(episode) == []
+        assert asyncio.run(extract_meta_beliefs_async(episode)) == []
+        mock_completion.assert_not_called()
+
+    def test_parses_fenced_response(self, mock_completion, sample_episode):
+        mock_completion.return_value = _canned_response("fenced")
+
+        beliefs = extract_meta_beliefs(sample_episode)
+        assert beliefs == [{"text": "Insight", "category": "meta"}]
+
     def test_prompt_includes_episode_data(self, mock_completion, sample_episode):
-        mock_completion.return_value = _mock_litellm_response({"meta_beliefs": []})
+        mock_completion.return_value = _canned_response("no_insights")
 
         extract_meta_beliefs(sample_episode)
 
@@ -119,9 +186,17 @@ class TestExtractMetaBeliefs:
         assert "2026-W06" in prompt_text
         assert "Zone 3 instead of Zone 2" in prompt_text
 
-    @patch("src.memory.episodes.chat_completion")
+    def test_prompt_static_prefix_precedes_episode_data(self, mock_completion, sample_episode):
+        mock_completion.return_value = _canned_response("no_insights")
+
+        extract_meta_beliefs(sample_episode)
+
+        prompt_text = mock_completion.call_args.kwargs["messages"][0]["content"]
+        assert prompt_text.startswith(_META_USER_PREFIX)
+        assert prompt_text.index("EPISODE:") < prompt_text.index("2026-W06")
+
     def test_uses_meta_reflection_system_prompt(self, mock_completion, sample_episode):
-        mock_completion.return_value = _mock_litellm_response({"meta_beliefs": []})
+        mock_completion.return_value = _canned_response("no_insights")
 
         extract_meta_beliefs(sample_episode)
 
@@ -129,15 +204,73 @@ class TestExtractMetaBeliefs:
         system_prompt = call_args.kwargs.get("system_prompt") or call_args[1].get("system_prompt")
         assert "coaching effectiveness" in system_prompt.lower()
 
+    def test_repeat_episode_served_from_cache(self, mock_completion, sample_episode):
+        mock_completion.return_value = _mock_litellm_response({
+            "meta_beliefs": [{"text": "Insight", "category": "meta", "confidence": 0.7}]
+        })
+
+        first = extract_meta_beliefs(sample_episode)
+        first[0]["text"] = "mutated by caller"
+        second = extract_meta_beliefs(sample_episode)
+
+        assert mock_completion.call_count == 1
+        assert second[0]["text"] == "Insight"
+
+    def test_malformed_response_not_cached(self, mock_completion, sample_episode):
+        mock_completion.return_value = _canned_response("malformed")
+
+        extract_meta_beliefs(sample_episode)
+        extract_meta_beliefs(sample_episode)
+
+        assert mock_completion.call_count == 2
+
+
+class TestExtractMetaBeliefsAsync:
+    def test_async_matches_sync_contract(self, mock_completion, sample_episode):
+        mock_completion.return_value = _canned_response("malformed")
+
+        assert asyncio.run(extract_meta_beliefs_async(sample_episode)) == []
+        prompt_text = mock_completion.call_args.kwargs["messages"][0]["content"]
+        assert "2026-W06" in prompt_text
+
+    def test_batch_calls_overlap(self, mock_completion, sample_episode):
+        # Each call waits at the barrier until the other has started, so a
+        # serial batch would time out instead of returning both results.
+        barrier = threading.Barrier(2, timeout=5)
+        response = _mock_litellm_response({
+            "meta_beliefs": [{"text": "Insight", "category": "meta", "confidence": 0.7}]
+        })
+
+        def _completion(**kwargs):
+            barrier.wait()
+            return response
+
+        mock_completion.side_effect = _completion
+
+        results = asyncio.run(extract_meta_beliefs_batch([sample_episode, sample_episode]))
+        assert [len(r) for r in results] == [1, 1]
+
+    def test_batch_maps_exceptions_to_empty(self, mock_completion, sample_episode, caplog):
+        mock_completion.side_effect = [RuntimeError("LLM down"), _canned_response("no_insights")]
+
+        with caplog.at_level("WARNING", logger="src.memory.episodes"):
+            results = asyncio.run(extract_meta_beliefs_batch([sample_episode, sample_episode]))
+        assert results == [[], []]
+        assert [r.exc_info[1].args for r in caplog.records] == [("LLM down",)]
+
+    def test_batch_propagates_cancellation(self, mock_completion, sample_episode):
+        mock_completion.side_effect = asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(extract_meta_beliefs_batch([sample_episode]))
+
 
 # -- Meta-Belief Storage in UserModel -----------------------------------------
 
 
 class TestMetaBeliefStorage:
-    def test_meta_beliefs_stored_like_regular_beliefs(self, tmp_path):
-        model_dir = tmp_path / "user_model"
-        model_dir.mkdir()
-        model = UserModel(data_dir=model_dir)
+    def test_meta_beliefs_stored_like_regular_beliefs(self, memory_user_model):
+        model = memory_user_model
 
         belief = model.add_belief(
             text="Athlete responds better to specific pace targets than HR zones",
@@ -148,10 +281,8 @@ class TestMetaBeliefStorage:
         assert belief["category"] == "meta"
         assert belief["active"] is True
 
-    def test_meta_beliefs_appear_in_active_beliefs(self, tmp_path):
-        model_dir = tmp_path / "user_model"
-        model_dir.mkdir()
-        model = UserModel(data_dir=model_dir)
+    def test_meta_beliefs_appear_in_active_beliefs(self, memory_user_model):
+        model = memory_user_model
 
         model.add_belief("Meta insight 1", "meta", confidence=0.8)
         model.add_belief("Regular belief", "fitness", confidence=0.9)
@@ -160,10 +291,8 @@ class TestMetaBeliefStorage:
         categories = [b["category"] for b in active]
         assert "meta" in categories
 
-    def test_meta_beliefs_in_model_summary(self, tmp_path):
-        model_dir = tmp_path / "user_model"
-        model_dir.mkdir()
-        model = UserModel(data_dir=model_dir)
+    def test_meta_beliefs_in_model_summary(self, memory_user_model):
+        model = memory_user_model
         model.update_structured_core("sports", ["running"])
 
         model.add_belief(
@@ -176,10 +305,8 @@ class TestMetaBeliefStorage:
         assert "[META]" in summary
         assert "rest day messaging" in summary
 
-    def test_meta_beliefs_filtered_by_confidence(self, tmp_path):
-        model_dir = tmp_path / "user_model"
-        model_dir.mkdir()
-        model = UserModel(data_dir=model_dir)
+    def test_meta_beliefs_filtered_by_confidence(self, memory_user_model):
+        model = memory_user_model
 
         model.add_belief("High confidence meta", "meta", confidence=0.9)
         model.add_belief("Low confidence meta", "meta", confidence=0.3)
@@ -229,8 +356,7 @@ class TestMetaBeliefInjection:
 
 
 class TestMetaBeliefLifecycle:
-    @patch("src.memory.episodes.chat_completion")
-    def test_full_lifecycle_extract_and_store(self, mock_completion, sample_episode, tmp_path):
+    def test_full_lifecycle_extract_and_store(self, mock_completion, sample_episode, memory_user_model):
         """Full flow: reflection -> extract meta-beliefs -> store in user model."""
         mock_completion.return_value = _mock_litellm_response({
             "meta_beliefs": [
@@ -248,18 +374,18 @@ class TestMetaBeliefLifecycle:
         assert len(meta_beliefs) == 1
 
         # Store in user model
-        model_dir = tmp_path / "user_model"
-        model_dir.mkdir()
-        model = UserModel(data_dir=model_dir)
-
-        for mb in meta_beliefs:
-            model.add_belief(
-                text=mb["text"],
-                category="meta",
-                confidence=mb["confidence"],
-                source="reflection",
-                source_ref=sample_episode.get("id"),
-            )
+        model = memory_user_model
+
+        model.add_beliefs([
+            {
+                "text": mb["text"],
+                "category": "meta",
+                "confidence": mb["confidence"],
+                "source": "reflection",
+                "source_ref": sample_episode.get("id"),
+            }
+            for mb in meta_beliefs
+        ])
 
         # Verify meta-belief is in model
         active_meta = model.get_active_beliefs(category="meta")
@@ -273,18 +399,58 @@ class TestMetaBeliefLifecycle:
         assert "Zone 2 discipline" in summary
 
 
+    def test_reflection_stores_meta_beliefs_in_one_batch(self):
+        from src.agent.reflection import _apply_meta_beliefs
+
+        user_model = MagicMock()
+        user_model.add_beliefs.side_effect = lambda specs: [dict(s, id="b") for s in specs]
+        meta_beliefs = [
+            {"text": "Zone 2 discipline needs reinforcement", "confidence": 0.8},
+            {"text": "", "confidence": 0.9},
+            {"text": "Thursday sessions should stay light"},
+        ]
+
+        applied = _apply_meta_beliefs(user_model, meta_beliefs, {"id": "ep_1"})
+
+        user_model.add_beliefs.assert_called_once_with([
+            {"text": "Zone 2 discipline needs reinforcement", "category": "meta",
+             "confidence": 0.8, "source": "reflection", "source_ref": "ep_1"},
+            {"text": "Thursday sessions should stay light", "category": "meta",
+             "confidence": 0.7, "source": "reflection", "source_ref": "ep_1"},
+        ])
+        user_model.add_belief.assert_not_called()
+        assert len(applied) == 2
+
+    def test_reflection_falls_back_per_belief_when_batch_fails(self):
+        from src.agent.reflection import _apply_meta_beliefs
+
+        user_model = MagicMock()
+        user_model.add_beliefs.side_effect = RuntimeError("DB down")
+        user_model.add_belief.side_effect = [RuntimeError("still down"), {"id": "b-2"}]
+
+        applied = _apply_meta_beliefs(
+            user_model, [{"text": "First"}, {"text": "Second"}], {"id": "ep_1"}
+        )
+
+        assert user_model.add_belief.call_count == 2
+        assert applied == [{"id": "b-2"}]
+
+
 # -- META_REFLECTION_PROMPT ---------------------------------------------------
 
 
+_META_PROMPT_LOWER = META_REFLECTION_PROMPT.lower()
+
+
 class TestMetaReflectionPrompt:
     def test_prompt_instructs_meta_analysis(self):
-        assert "coaching effectiveness" in META_REFLECTION_PROMPT.lower()
+        assert "coaching effectiveness" in _META_PROMPT_LOWER
 
     def test_prompt_requires_json(self):
         assert "JSON" in META_REFLECTION_PROMPT
 
     def test_prompt_includes_examples(self):
-        assert "zone discipline" in META_REFLECTION_PROMPT.lower() or "easy sessions" in META_REFLECTION_PROMPT.lower()
+        assert "zone discipline" in _META_PROMPT_LOWER or "easy sessions" in _META_PROMPT_LOWER
 
     def test_prompt_output_schema(self):
         assert "meta_beliefs" in META_REFLECTION_PROMPT